@@ -0,0 +1,30 @@
+# cython: language_level=3
+"""
+Compiled scoring loop for SimplePredict.suggest().
+Build with: cythonize -i modules/_predict_core.pyx
+predictor.py falls back to an equivalent pure-Python loop when this is not built.
+"""
+
+
+cpdef list suggest_core(list words_lower, list normalized, str q_lower, str q_norm, int limit):
+    """Return up to `limit` (-score, index) pairs, best score first, ties in word order"""
+    cdef list scores = []
+    cdef Py_ssize_t i, n = len(words_lower)
+    cdef int s
+    cdef str wl, wn
+    for i in range(n):
+        wl = words_lower[i]
+        wn = normalized[i]
+        if wl.startswith(q_lower):
+            s = 100
+        elif wn.startswith(q_norm):
+            s = 90
+        elif q_lower in wl:
+            s = 70
+        elif q_norm in wn:
+            s = 60
+        else:
+            continue
+        scores.append((-s, i))
+    scores.sort()
+    return scores[:limit]
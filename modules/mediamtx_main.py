@@ -121,47 +121,53 @@ motor_heartbeat_timeout = 1.5  # Stop motors if no heartbeat for 1.5 seconds
 motor_watchdog_lock = threading.Lock()
 motor_clients_connected = set()  # Track connected clients that control motors
 
-def motor_safety_watchdog():
+def motor_safety_check():
     """
-    Motor safety watchdog thread.
+    One pass of the motor safety watchdog.
     Automatically stops motors if:
     1. No heartbeat received within timeout period
     2. All WebSocket clients disconnect
     3. USB serial link fails (handled in motor_controller.py)
     """
-    global motor_watchdog_active, motor_last_heartbeat
+    with motor_watchdog_lock:
+        time_since_heartbeat = time.time() - motor_last_heartbeat
+        clients_count = len(motor_clients_connected)
+        
+        # Stop motors if no heartbeat for too long
+        if time_since_heartbeat > motor_heartbeat_timeout:
+            # Only log and stop if we think motors might be moving
+            if time_since_heartbeat < motor_heartbeat_timeout + 2:  # Log once
+                print(f"[Motor Safety] ⚠️  No heartbeat for {time_since_heartbeat:.1f}s - STOPPING MOTORS")
+                try:
+                    from modules.motor_controller import motors
+                    motors.stop()
+                except Exception as e:
+                    print(f"[Motor Safety] Error stopping motors: {e}")
+        
+        # Stop motors if no clients connected
+        if clients_count == 0 and time_since_heartbeat < 5:  # Only if recently had clients
+            print("[Motor Safety] ⚠️  No clients connected - STOPPING MOTORS")
+            try:
+                from modules.motor_controller import motors
+                motors.stop()
+            except Exception as e:
+                print(f"[Motor Safety] Error stopping motors: {e}")
+
+def motor_safety_watchdog():
+    """
+    Motor safety watchdog thread.
+    Runs motor_safety_check() every 500ms on a dedicated thread, so the slower
+    monitors (which may restart the stream and sleep) can never delay it.
+    """
+    global motor_watchdog_active
     
     print("[Motor Safety] Watchdog thread started")
     motor_watchdog_active = True
     
     while motor_watchdog_active:
         try:
-            with motor_watchdog_lock:
-                time_since_heartbeat = time.time() - motor_last_heartbeat
-                clients_count = len(motor_clients_connected)
-                
-                # Stop motors if no heartbeat for too long
-                if time_since_heartbeat > motor_heartbeat_timeout:
-                    # Only log and stop if we think motors might be moving
-                    if time_since_heartbeat < motor_heartbeat_timeout + 2:  # Log once
-                        print(f"[Motor Safety] ⚠️  No heartbeat for {time_since_heartbeat:.1f}s - STOPPING MOTORS")
-                        try:
-                            from modules.motor_controller import motors
-                            motors.stop()
-                        except Exception as e:
-                            print(f"[Motor Safety] Error stopping motors: {e}")
-                
-                # Stop motors if no clients connected
-                if clients_count == 0 and time_since_heartbeat < 5:  # Only if recently had clients
-                    print("[Motor Safety] ⚠️  No clients connected - STOPPING MOTORS")
-                    try:
-                        from modules.motor_controller import motors
-                        motors.stop()
-                    except Exception as e:
-                        print(f"[Motor Safety] Error stopping motors: {e}")
-            
+            motor_safety_check()
             time.sleep(0.5)  # Check every 500ms
-            
         except Exception as e:
             print(f"[Motor Safety] Watchdog error: {e}")
             time.sleep(1)
@@ -816,7 +822,7 @@ def wifi_scan_api():
     try:
         if not wifi_manager:
             return jsonify({'ok': False, 'msg': 'Wi-Fi manager unavailable'}), 501
-        return jsonify({'ok': True, 'networks': wifi_manager.scan()})
+        return jsonify({'ok': True, 'networks': wifi_manager.scan(force=True)})
     except Exception as e:
         return jsonify({'ok': False, 'msg': str(e)}), 500
 
@@ -3497,25 +3503,14 @@ def resume_recording():
 
 # Bandwidth management thread removed
 
-# Background CPU monitoring thread
-def cpu_monitoring_thread():
-    """Background thread to monitor CPU usage and trigger optimizations"""
-    import time
-    from modules.mediamtx_camera import auto_reduce_quality, streaming_active, get_cpu_usage
-    
-    while True:
-        try:
-            if streaming_active:
-                cpu_usage = get_cpu_usage()
-                if cpu_usage > 80:  # High CPU usage
-                    print(f"[CPU Monitor] High CPU usage detected: {cpu_usage:.1f}%")
-                    auto_reduce_quality()
-            
-            time.sleep(10)  # Check every 10 seconds
-            
-        except Exception as e:
-            print(f"[CPU Monitor] Error in monitoring thread: {e}")
-            time.sleep(30)  # Wait longer on error
+# Background CPU monitoring check
+def cpu_monitoring_check(streaming_active, get_cpu_usage, auto_reduce_quality):
+    """Check CPU usage and trigger optimizations"""
+    if streaming_active:
+        cpu_usage = get_cpu_usage()
+        if cpu_usage > 80:  # High CPU usage
+            print(f"[CPU Monitor] High CPU usage detected: {cpu_usage:.1f}%")
+            auto_reduce_quality()
 
 def stream_health_monitor_thread():
     """Background thread to monitor stream health and fix state synchronization issues"""
@@ -3588,45 +3583,81 @@ def stream_health_monitor_thread():
             print(f"[Stream Health] Error in health monitoring thread: {e}")
             time.sleep(30)  # Wait longer on error
 
-# Background audio quality monitoring thread
-def audio_quality_monitor_thread():
-    """Background thread to monitor and adjust audio quality"""
-    import time
-    from modules.mediamtx_camera import adjust_audio_quality, streaming_active
-    
-    while True:
-        try:
-            if streaming_active:
-                # Check and adjust audio quality
-                new_bitrate = adjust_audio_quality()
+# Background audio quality monitoring check
+def audio_quality_check(streaming_active, adjust_audio_quality):
+    """Monitor and adjust audio quality"""
+    if streaming_active:
+        # Check and adjust audio quality
+        new_bitrate = adjust_audio_quality()
+        
+        # If bitrate changed, restart stream
+        if new_bitrate != getattr(audio_quality_check, 'last_bitrate', 32):
+            print(f"[Audio Monitor] Bitrate changed to {new_bitrate}kbps, restarting stream...")
+            try:
+                # Stop current stream
+                from modules.mediamtx_camera import stop_streaming
+                stop_result = stop_streaming()
                 
-                # If bitrate changed, restart stream
-                if new_bitrate != getattr(audio_quality_monitor_thread, 'last_bitrate', 32):
-                    print(f"[Audio Monitor] Bitrate changed to {new_bitrate}kbps, restarting stream...")
-                    try:
-                        # Stop current stream
-                        from modules.mediamtx_camera import stop_streaming
-                        stop_result = stop_streaming()
-                        
-                        if stop_result.get('ok'):
-                            time.sleep(1)
-                            # Start new stream with adjusted bitrate
-                            from modules.mediamtx_camera import start_streaming
-                            start_result = start_streaming()
-                            if start_result.get('ok'):
-                                print(f"[Audio Monitor] ✓ Stream restarted with {new_bitrate}kbps audio")
-                            else:
-                                print(f"[Audio Monitor] ✗ Failed to restart stream: {start_result}")
-                    except Exception as e:
-                        print(f"[Audio Monitor] Error restarting stream: {e}")
-                    
-                    audio_quality_monitor_thread.last_bitrate = new_bitrate
-            
-            time.sleep(5)  # Check every 5 seconds
+                if stop_result.get('ok'):
+                    time.sleep(1)
+                    # Start new stream with adjusted bitrate
+                    from modules.mediamtx_camera import start_streaming
+                    start_result = start_streaming()
+                    if start_result.get('ok'):
+                        print(f"[Audio Monitor] ✓ Stream restarted with {new_bitrate}kbps audio")
+                    else:
+                        print(f"[Audio Monitor] ✗ Failed to restart stream: {start_result}")
+            except Exception as e:
+                print(f"[Audio Monitor] Error restarting stream: {e}")
             
+            audio_quality_check.last_bitrate = new_bitrate
+
+def _schedule_monitor(scheduler, name, check, period, error_period):
+    """Register a periodic check that re-enters itself on the shared scheduler"""
+    def tick(scheduler):
+        if not monitor_loop_active:
+            return
+        try:
+            check()
+            delay = period
         except Exception as e:
-            print(f"[Audio Monitor] Error in monitoring thread: {e}")
-            time.sleep(10)  # Wait longer on error
+            print(f"[{name}] Error in monitoring loop: {e}")
+            delay = error_period  # Wait longer on error
+        scheduler.enter(delay, 1, tick, argument=(scheduler,))
+    
+    scheduler.enter(0, 1, tick, argument=(scheduler,))
+
+# Single background loop for the stream monitors (one thread instead of one per monitor).
+# The motor safety watchdog is deliberately not on it: these checks can block for
+# seconds while they restart the stream.
+monitor_loop_active = False
+
+def monitor_loop():
+    """Drive the CPU and audio quality monitors from one sched.scheduler"""
+    import sched
+    global monitor_loop_active
+    
+    monitor_loop_active = True
+    scheduler = sched.scheduler(time.time, time.sleep)
+    
+    try:
+        from modules.mediamtx_camera import (
+            auto_reduce_quality, adjust_audio_quality, streaming_active, get_cpu_usage
+        )
+        _schedule_monitor(scheduler, 'CPU Monitor',
+                          lambda: cpu_monitoring_check(streaming_active, get_cpu_usage, auto_reduce_quality),
+                          10, 30)
+        print("[CPU Monitor] Background CPU monitoring started")
+        _schedule_monitor(scheduler, 'Audio Monitor',
+                          lambda: audio_quality_check(streaming_active, adjust_audio_quality),
+                          5, 10)
+        print("[Audio Monitor] Background audio quality monitoring started")
+    except Exception as e:
+        print(f"[Monitor] CPU/audio monitors not available: {e}")
+        return
+    
+    scheduler.run()
+    print("[Monitor] Monitor loop stopped")
 
 @socketio.on('audio_input_pcm')
 def handle_audio_input_pcm(data):
@@ -3669,15 +3700,14 @@ if __name__ == "__main__":
     
     import threading
     
-    # Start CPU monitoring thread
-    cpu_thread = threading.Thread(target=cpu_monitoring_thread, daemon=True)
-    cpu_thread.start()
-    print("[CPU Monitor] Background CPU monitoring started")
+    # Motor safety watchdog gets its own thread so nothing can stall it
+    motor_watchdog_thread = threading.Thread(target=motor_safety_watchdog, daemon=True)
+    motor_watchdog_thread.start()
+    print("[Motor Safety] Motor safety watchdog started - monitors heartbeat and connections")
     
-    # Start audio quality monitoring thread
-    monitor_thread = threading.Thread(target=audio_quality_monitor_thread, daemon=True)
+    # Start the shared monitor loop (CPU, audio quality)
+    monitor_thread = threading.Thread(target=monitor_loop, daemon=True)
     monitor_thread.start()
-    print("[Audio Monitor] Background audio quality monitoring started")
     
     # DISABLED: Stream health monitoring was causing automatic restarts and crashes
     # Users should manually start/stop streams via the UI for stability
@@ -3685,9 +3715,4 @@ if __name__ == "__main__":
     # health_thread.start()
     print("[Stream Health] Stream health auto-monitoring DISABLED for stability")
     
-    # Start motor safety watchdog thread
-    motor_watchdog_thread = threading.Thread(target=motor_safety_watchdog, daemon=True)
-    motor_watchdog_thread.start()
-    print("[Motor Safety] Motor safety watchdog started - monitors heartbeat and connections")
-    
     main()
@@ -9,6 +9,7 @@ import threading
 import os
 import datetime
 import time
+import signal
 import sys
 from subprocess import PIPE
 from pathlib import Path
@@ -52,6 +53,27 @@ Path("snapshots").mkdir(exist_ok=True)
 Path("recordings").mkdir(exist_ok=True)
 Path("sounds").mkdir(exist_ok=True)
 
+# Static parts of the ffmpeg recording command (MediaMTX-compatible settings),
+# built once so start() only fills in the per-recording values
+_VIDEO_ARGS_PREFIX = ("ffmpeg", "-hide_banner", "-loglevel", "error", "-f", "v4l2")
+_VIDEO_INPUT = "/dev/video0"
+_AUDIO_INPUT_ARGS = ("-f", "alsa")
+_AUDIO_CODEC_ARGS = ("-c:a", "libopus")  # Use Opus codec for MediaMTX compatibility
+_VIDEO_ENCODE_ARGS = (
+    "-c:v", "libx264",
+    "-preset", "ultrafast",
+    "-tune", "zerolatency",
+    "-g", "20",
+    "-keyint_min", "10",
+    "-sc_threshold", "0",
+    "-b:v", "200k",
+    "-maxrate", "200k",
+    "-bufsize", "400k",
+    "-pix_fmt", "yuv420p",
+    "-movflags", "+faststart",
+    "-y",
+)
+
 
 class MediaMTXRecordingManager:
     """MediaMTX-compatible recording manager"""
@@ -103,11 +125,24 @@ class MediaMTXRecordingManager:
             # DISABLED: External FFmpeg management is handled by monitor_stream.sh
             # subprocess.run(['pkill', '-f', 'ffmpeg'], capture_output=True)
             
-            # Kill any existing arecord processes
-            subprocess.run(['pkill', '-f', 'arecord'], capture_output=True)
+            # Kill any existing arecord processes (scan /proc directly instead of forking pkill)
+            killed = 0
+            with os.scandir('/proc') as it:
+                for entry in it:
+                    if not entry.name.isdigit():
+                        continue
+                    try:
+                        with open(f'/proc/{entry.name}/comm') as f:
+                            name = f.read().strip()
+                        if name == 'arecord':
+                            os.kill(int(entry.name), signal.SIGTERM)
+                            killed += 1
+                    except (FileNotFoundError, ProcessLookupError, PermissionError):
+                        continue
             
             # Wait a moment for processes to terminate
-            time.sleep(0.5)
+            if killed:
+                time.sleep(0.5)
             
         except Exception as e:
             print(f"[MediaMTX Recorder] Warning: Could not kill conflicting processes: {e}")
@@ -143,50 +178,33 @@ class MediaMTXRecordingManager:
             # Use provided bitrate or current setting
             audio_bitrate = a_bitrate or current_audio_bitrate
             
-            # Build ffmpeg command with MediaMTX-compatible settings
-            cmd = [
-                "ffmpeg",
-                "-hide_banner",
-                "-loglevel", "error",
-                "-f", "v4l2",
+            # Build ffmpeg command from the precomputed templates
+            video_input = (
                 "-framerate", str(fps),
                 "-video_size", f"{width}x{height}",
-                "-i", "/dev/video0",
-            ]
+                "-i", _VIDEO_INPUT,
+            )
             
             # Add audio if available and working
             audio_available = self._test_audio_setup()
             if audio_available:
                 print("[MediaMTX Recorder] Adding audio to recording")
-                cmd.extend([
-                    "-f", "alsa",
+                channels = str(current_audio_channels)
+                audio_args = _AUDIO_INPUT_ARGS + (
                     "-ar", str(current_audio_sample_rate),
-                    "-ac", str(current_audio_channels),
+                    "-ac", channels,
                     "-i", MIC_PLUG,
-                    "-c:a", "libopus",  # Use Opus codec for MediaMTX compatibility
+                ) + _AUDIO_CODEC_ARGS + (
                     "-b:a", audio_bitrate,
-                    "-ac", str(current_audio_channels)
-                ])
+                    "-ac", channels,
+                )
                 self.recording_mode = 'full'
             else:
                 print("[MediaMTX Recorder] No audio available, recording video only")
+                audio_args = ()
                 self.recording_mode = 'video_only'
             
-            # Video encoding options with MediaMTX-compatible settings
-            cmd.extend([
-                "-c:v", "libx264",
-                "-preset", "ultrafast",
-                "-tune", "zerolatency",
-                "-g", "20",
-                "-keyint_min", "10",
-                "-sc_threshold", "0",
-                "-b:v", "200k",
-                "-maxrate", "200k",
-                "-bufsize", "400k",
-                "-pix_fmt", "yuv420p",
-                "-movflags", "+faststart",
-                "-y", output_file
-            ])
+            cmd = _VIDEO_ARGS_PREFIX + video_input + audio_args + _VIDEO_ENCODE_ARGS + (output_file,)
             
             print(f"[MediaMTX Recorder] Command: {' '.join(cmd)}")
             
@@ -5,8 +5,144 @@ Handles word prediction and text suggestions.
 """
 
 import os
-import glob
+import mmap
+import hashlib
+import atexit
+import bisect
+import struct
+import threading
 import unicodedata
+from collections import deque
+
+# Diacritics used by the ro/de dictionaries, mapped to their plain ASCII form.
+# Input is lowercased first, so only lowercase letters are needed here.
+_DIACRITIC_MAP = str.maketrans({
+    'ă': 'a', 'â': 'a', 'î': 'i', 'ș': 's', 'ț': 't', 'ş': 's', 'ţ': 't',
+    'ä': 'a', 'ö': 'o', 'ü': 'u', 'ß': 'ss',
+})
+
+
+def _normalize(text):
+    """Lowercase and remove diacritics for accent-insensitive matching"""
+    normalized = text.lower().translate(_DIACRITIC_MAP)
+    if normalized.isascii():
+        return normalized
+    # Unrecognized script: fall back to full Unicode decomposition
+    return ''.join(c for c in unicodedata.normalize('NFD', normalized) if unicodedata.category(c) != 'Mn')
+
+
+def _suggest_core_py(words_lower, normalized, q_lower, q_norm, limit):
+    """Return up to `limit` (-score, index) pairs, best score first, ties in word order"""
+    scores = []
+    for i, (wl, wn) in enumerate(zip(words_lower, normalized)):
+        # Exact match gets highest score
+        if wl.startswith(q_lower):
+            s = 100
+        # Normalized match gets high score
+        elif wn.startswith(q_norm):
+            s = 90
+        # Contains match gets medium score
+        elif q_lower in wl:
+            s = 70
+        # Normalized contains gets lower score
+        elif q_norm in wn:
+            s = 60
+        else:
+            continue
+        scores.append((-s, i))
+    scores.sort()
+    return scores[:limit]
+
+
+# words.idx layout: header, then (offset, length) per word, then the packed UTF-8 bytes
+_INDEX_FILE = "words.idx"
+_INDEX_MAGIC = b"AVW2"
+_INDEX_HEADER = struct.Struct("<4sI32s")  # magic, word count, fingerprint of the source files
+_INDEX_ENTRY = struct.Struct("<II")       # offset into data, byte length
+
+
+def _dict_fingerprint(txt_files):
+    """SHA-256 over (name, size, mtime_ns) of every dictionary file.
+    
+    Catches removed or emptied files and files deployed with older mtimes
+    (rsync -a, tar x), which a newer-than-index check misses.
+    """
+    h = hashlib.sha256()
+    for name, st in sorted((entry.name, entry.stat()) for entry in txt_files):
+        h.update(f"{name}\0{st.st_size}\0{st.st_mtime_ns}\n".encode("utf-8"))
+    return h.digest()
+
+
+def build_dict_index(dict_dir, words, fingerprint):
+    """Write the merged, sorted word list to words.idx for fast startup loading"""
+    encoded = [w.encode("utf-8") for w in words]
+    entries = bytearray()
+    offset = 0
+    for data in encoded:
+        entries += _INDEX_ENTRY.pack(offset, len(data))
+        offset += len(data)
+    
+    index_file = os.path.join(dict_dir, _INDEX_FILE)
+    tmp_file = index_file + ".tmp"
+    with open(tmp_file, "wb") as f:
+        f.write(_INDEX_HEADER.pack(_INDEX_MAGIC, len(encoded), fingerprint))
+        f.write(entries)
+        f.write(b"".join(encoded))
+    os.replace(tmp_file, index_file)
+
+
+class WordArray:
+    """Read-only word sequence backed by an mmap of words.idx.
+    
+    The mapping is shared through the page cache by every process that opens
+    the same index file.
+    """
+    
+    def __init__(self, path):
+        with open(path, "rb") as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, self._count, self.fingerprint = _INDEX_HEADER.unpack_from(self._mm, 0)
+        if magic != _INDEX_MAGIC:
+            self._mm.close()
+            raise ValueError(f"{path} is not a word index")
+        self._data_start = _INDEX_HEADER.size + self._count * _INDEX_ENTRY.size
+    
+    def __len__(self):
+        return self._count
+    
+    def __getitem__(self, i):
+        if i < 0:
+            i += self._count
+        if not 0 <= i < self._count:
+            raise IndexError("word index out of range")
+        offset, length = _INDEX_ENTRY.unpack_from(self._mm, _INDEX_HEADER.size + i * _INDEX_ENTRY.size)
+        start = self._data_start + offset
+        return self._mm[start:start + length].decode("utf-8")
+    
+    def close(self):
+        self._mm.close()
+
+
+def _load_dict_index(dict_dir, fingerprint):
+    """Return the words from words.idx, or None if it is missing or was built from other dictionaries"""
+    index_file = os.path.join(dict_dir, _INDEX_FILE)
+    try:
+        words = WordArray(index_file)
+        try:
+            if words.fingerprint != fingerprint:
+                return None
+            return list(words)
+        finally:
+            words.close()
+    except (OSError, ValueError, struct.error):
+        return None
+
+
+# Optional compiled scoring loop (see _predict_core.pyx)
+try:
+    from modules._predict_core import suggest_core
+except ImportError:
+    suggest_core = _suggest_core_py
 
 
 class SimplePredict:
@@ -14,18 +150,46 @@ class SimplePredict:
         self.dict_dir = dict_dir
         self.words = []
         self.language_words = {}  # Store words by language
+        self._words_lower = []  # Lowercased self.words, same order
+        self._normalized = []   # Diacritic-free self.words, same order
+        self._normalized_lang = {}  # Diacritic-free language_words, same order
+        # Guards self.words and its derived lists so suggest() never sees them mid-update
+        self._words_lock = threading.Lock()
+        
+        # Learned words are appended to custom_words.txt by a background writer
+        # so callers never block on disk I/O
+        self._pending_writes = deque()
+        self._flush_event = threading.Event()
+        self._flush_thread = threading.Thread(target=self._flush_worker, daemon=True)
+        self._flush_thread.start()
+        atexit.register(self.flush_pending_words)
+        
         self.reload()
 
     def reload(self):
+        with self._words_lock:
+            self._reload()
+
+    def _reload(self):
         self.words.clear()
         self.language_words.clear()
         
         try:
             os.makedirs(self.dict_dir, exist_ok=True)
             
+            # Dictionary files present in dict_dir
+            with os.scandir(self.dict_dir) as it:
+                txt_files = [entry for entry in it
+                             if not entry.name.startswith(".") and entry.name.endswith(".txt")
+                             and entry.is_file()]
+            
+            # Use the prebuilt word index when it was built from exactly these dictionary files
+            fingerprint = _dict_fingerprint(txt_files)
+            cached_words = _load_dict_index(self.dict_dir, fingerprint)
+            
             # Load words from the specific words.txt file first
             words_file = os.path.join(self.dict_dir, "words.txt")
-            if os.path.exists(words_file):
+            if cached_words is None and os.path.exists(words_file):
                 try:
                     with open(words_file, "r", encoding="utf-8", errors="ignore") as f:
                         for line in f:
@@ -59,34 +223,54 @@ class SimplePredict:
                     except Exception as e:
                         print(f"[Predict] failed to load {filename}: {e}")
             
-            # Load additional words from other dictionary files
-            for fn in glob.glob(os.path.join(self.dict_dir, "*.txt")):
-                if os.path.basename(fn) in ["words.txt", "en_common.txt", "ro_common.txt", "de_common.txt"]:
-                    continue  # Already loaded
-                try:
-                    with open(fn, "r", encoding="utf-8", errors="ignore") as f:
-                        for line in f:
-                            w = line.strip()
-                            if w:
-                                self.words.append(w)
-                    # Special logging for custom words file
-                    if os.path.basename(fn) == "custom_words.txt":
-                        print(f"[Predict] loaded custom learned words from {fn}")
-                except Exception as e:
-                    print("[Predict] failed to load", fn, e)
-            
-            # Remove duplicates and sort
-            self.words = sorted(set(self.words))
+            if cached_words is not None:
+                self.words = cached_words
+                print(f"[Predict] loaded {len(self.words)} words from {_INDEX_FILE}")
+            else:
+                # Load additional words from other dictionary files
+                skip = {"words.txt", "en_common.txt", "ro_common.txt", "de_common.txt"}  # Already loaded
+                for entry in txt_files:
+                    if entry.name in skip:
+                        continue
+                    try:
+                        with open(entry.path, "r", encoding="utf-8", errors="ignore") as f:
+                            for line in f:
+                                w = line.strip()
+                                if w:
+                                    self.words.append(w)
+                        # Special logging for custom words file
+                        if entry.name == "custom_words.txt":
+                            print(f"[Predict] loaded custom learned words from {entry.path}")
+                    except Exception as e:
+                        print("[Predict] failed to load", entry.path, e)
+                
+                # Remove duplicates and sort
+                self.words = sorted(set(self.words))
+                
+                if self.words:
+                    try:
+                        build_dict_index(self.dict_dir, self.words, fingerprint)
+                    except Exception as e:
+                        print(f"[Predict] failed to write {_INDEX_FILE}: {e}")
             print(f"[Predict] total {len(self.words)} unique words loaded")
             
             # Add some common words if dictionary is empty
             if not self.words:
-                self.words = ["hello", "help", "please", "thank", "you", "yes", "no", "stop", "go", "forward", "back", "left", "right", "battery", "camera", "audio", "video", "record", "snapshot", "move", "motor", "system", "status", "reboot", "volume", "microphone", "speaker"]
+                self.words = sorted(["hello", "help", "please", "thank", "you", "yes", "no", "stop", "go", "forward", "back", "left", "right", "battery", "camera", "audio", "video", "record", "snapshot", "move", "motor", "system", "status", "reboot", "volume", "microphone", "speaker"])
                 print(f"[Predict] using fallback words: {len(self.words)} words")
                 
         except Exception as e:
             print(f"[Predict] reload error: {e}")
-            self.words = ["error", "loading", "words"]  # Minimal fallback
+            self.words = ["error", "loading", "words"]  # Minimal fallback (sorted)
+        
+        self._build_index()
+
+    def _build_index(self):
+        """Precompute lowercased and normalized forms of self.words for suggest()"""
+        self._words_lower = [w.lower() for w in self.words]
+        self._normalized = [_normalize(w) for w in self.words]
+        self._normalized_lang = {lang: [_normalize(w) for w in lw]
+                                 for lang, lw in self.language_words.items()}
 
     def suggest(self, prefix, limit=50):
         if not prefix:
@@ -100,49 +284,13 @@ class SimplePredict:
         # Get only the last word for prediction (ignore preceding text)
         current_word = prefix_parts[-1].lower()
         
-        matches = []
-        
-        # Enhanced diacritics support
-        def normalize_text(text):
-            # Remove diacritics but keep original structure
-            normalized = ''.join(c for c in unicodedata.normalize('NFD', text) if unicodedata.category(c) != 'Mn')
-            return normalized.lower()
-        
-        def text_similarity(word, query):
-            """Calculate text similarity for better Romanian matching"""
-            word_norm = normalize_text(word)
-            query_norm = normalize_text(query)
+        # Query forms are computed once; word forms are cached by reload()
+        with self._words_lock:
+            scores = suggest_core(self._words_lower, self._normalized,
+                                  current_word, _normalize(current_word), limit)
             
-            # Exact match gets highest score
-            if word.lower().startswith(query.lower()):
-                return 100
-            # Normalized match gets high score
-            elif word_norm.startswith(query_norm):
-                return 90
-            # Contains match gets medium score
-            elif query.lower() in word.lower():
-                return 70
-            # Normalized contains gets lower score
-            elif query_norm in word_norm:
-                return 60
-            else:
-                return 0
-        
-        # Score and collect all potential matches
-        word_scores = []
-        for word in self.words:
-            score = text_similarity(word, current_word)
-            if score > 0:
-                word_scores.append((score, word))
-        
-        # Sort by score (highest first) and extract words
-        word_scores.sort(key=lambda x: x[0], reverse=True)
-        
-        # Return only individual words (no phrase building)
-        for score, word in word_scores[:limit]:
-            matches.append(word)
-            
-        return matches[:limit]
+            # Return only individual words (no phrase building)
+            return [self.words[i] for _, i in scores]
 
     def add_words_from_text(self, text):
         """Extract and save new words from typed text"""
@@ -156,21 +304,25 @@ class SimplePredict:
             words = re.findall(r'\b[a-zA-ZăâîșțĂÂÎȘȚ]+\b', text.lower())
             
             new_words = []
-            for word in words:
-                # Only save words that are 2+ characters and not already in dictionary
-                if len(word) >= 2 and word not in self.words:
+            with self._words_lock:
+                for word in words:
+                    # Only save words that are 2+ characters and not already in dictionary
+                    if len(word) < 2:
+                        continue
+                    # self.words is kept sorted: binary search, then insert the word and its
+                    # derived forms at the same position instead of rebuilding every list
+                    i = bisect.bisect_left(self.words, word)
+                    if i < len(self.words) and self.words[i] == word:
+                        continue
                     new_words.append(word)
-                    self.words.append(word)
+                    self.words.insert(i, word)
+                    self._words_lower.insert(i, word)  # Already lowercase
+                    self._normalized.insert(i, _normalize(word))
             
             # Save new words to the custom words file
             if new_words:
-                custom_words_file = os.path.join(self.dict_dir, "custom_words.txt")
-                with open(custom_words_file, "a", encoding="utf-8") as f:
-                    for word in new_words:
-                        f.write(word + "\n")
-                
-                # Resort the words list for better prediction performance
-                self.words = sorted(set(self.words))
+                self._pending_writes.extend(new_words)
+                self._flush_event.set()
                 print(f"[Predict] Learned {len(new_words)} new words: {', '.join(new_words[:5])}{'...' if len(new_words) > 5 else ''}")
                 return len(new_words)
         except Exception as e:
@@ -178,6 +330,29 @@ class SimplePredict:
         
         return 0
     
+    def _flush_worker(self):
+        """Background thread: batch queued learned words into custom_words.txt"""
+        while True:
+            self._flush_event.wait()
+            self._flush_event.clear()
+            self.flush_pending_words()
+
+    def flush_pending_words(self):
+        """Write all queued learned words with a single open/write/close"""
+        batch = []
+        while self._pending_writes:
+            batch.append(self._pending_writes.popleft())
+        if not batch:
+            return 0
+        
+        try:
+            custom_words_file = os.path.join(self.dict_dir, "custom_words.txt")
+            with open(custom_words_file, "a", encoding="utf-8") as f:
+                f.write("\n".join(batch) + "\n")
+        except Exception as e:
+            print(f"[Predict] Error saving learned words: {e}")
+        return len(batch)
+    
     def get_language_words(self, language='en'):
         """Get words specific to a language"""
         return self.language_words.get(language, [])
@@ -200,20 +375,10 @@ class SimplePredict:
         if not lang_words:
             return self.suggest(prefix, limit)  # Fallback to all words
         
-        matches = []
-        
-        # Enhanced diacritics support
-        def normalize_text(text):
-            # Remove diacritics but keep original structure
-            normalized = ''.join(c for c in unicodedata.normalize('NFD', text) if unicodedata.category(c) != 'Mn')
-            return normalized.lower()
-        
-        normalized_prefix = normalize_text(current_word)
-        
-        for word in lang_words:
-            normalized_word = normalize_text(word)
-            if normalized_word.startswith(normalized_prefix):
-                matches.append(word)
+        normalized_prefix = _normalize(current_word)
+        normalized_words = self._normalized_lang.get(language, [])
+        matches = [lang_words[i] for i, nw in enumerate(normalized_words)
+                   if nw.startswith(normalized_prefix)]
         
         # Sort matches by length (shorter first) and then alphabetically
         matches.sort(key=lambda x: (len(x), x.lower()))
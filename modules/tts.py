@@ -8,13 +8,136 @@ import subprocess
 import shutil
 import os
 import glob
+import re
 import asyncio
-import edge_tts
+import concurrent.futures
 import tempfile
 import time
+import json
+import logging
+import queue
+import select
+import socket
+import sys
+import hashlib
+import io
+import itertools
+import threading
+import wave
+from collections import OrderedDict
 from pathlib import Path
 from modules.device_detector import SPK_PLUG
 
+log = logging.getLogger("tts")
+
+# edge_tts pulls in aiohttp and its SSL stack; import it on first online use only
+_edge_tts = None
+
+
+def _get_edge_tts():
+    global _edge_tts
+    if _edge_tts is None:
+        import edge_tts as _edge_tts
+    return _edge_tts
+
+
+try:
+    # Optional: play Piper output through an in-process ALSA PCM instead of spawning aplay
+    import alsaaudio
+    ALSAAUDIO_AVAILABLE = True
+except ImportError:
+    ALSAAUDIO_AVAILABLE = False
+
+try:
+    # Optional: decode Edge-TTS MP3 in-process (with alsaaudio) instead of an mpg123 | aplay pipeline
+    import miniaudio
+    MINIAUDIO_AVAILABLE = True
+except ImportError:
+    MINIAUDIO_AVAILABLE = False
+
+# Edge-TTS default output format is 24 kHz mono MP3
+EDGE_TTS_RATE = 24000
+# Max concurrent Edge-TTS requests for multi-sentence text (the service throttles/bans bursts)
+EDGE_TTS_CONCURRENCY = 3
+# Max wait for one Edge-TTS synthesis (not its playback), and a last-resort bound on a whole utterance
+EDGE_TTS_SYNTH_TIMEOUT = 30
+EDGE_TTS_UTTERANCE_TIMEOUT = 600
+
+# Warm Piper: the first reply includes the cold ONNX load (slow on a Pi), later replies
+# only synthesis; after PIPER_WARM_MAX_FAILURES failures in a row a command is run one-shot
+PIPER_WARM_FIRST_TIMEOUT = 15
+PIPER_WARM_TIMEOUT = 30
+PIPER_WARM_MAX_FAILURES = 2
+# Resident Piper processes (one model each); the least recently used idle one is stopped
+PIPER_WARM_MAX_PROCS = 2
+
+# ALSA PCM period size (frames)
+PCM_PERIOD_FRAMES = 1024
+
+# Sentence boundaries for pipelined Piper / parallel Edge-TTS synthesis
+_SENTENCE_RE = re.compile(r'(?<=[.!?])\s+(?=\w)')
+
+# Common Romanian question words (used to emphasize question intonation for Piper)
+_Q_RE = re.compile(r'\b(ce|cum|unde|când|de ce|cine|care|cât|câte|câți|câteva)\b', re.IGNORECASE)
+
+
+def _eventlet_patched():
+    """True when eventlet has monkey-patched threads (mediamtx_main does, for the web server)"""
+    eventlet = sys.modules.get('eventlet')
+    return eventlet is not None and eventlet.patcher.is_monkey_patched('thread')
+
+
+def _os_threading():
+    """The real threading module; under eventlet the patched one only makes greenlets"""
+    if _eventlet_patched():
+        return sys.modules['eventlet'].patcher.original('threading')
+    return threading
+
+
+def _offload(fn, *args):
+    """Call fn, which blocks in C (ALSA writes, MP3 decoding), from a greenlet without
+    freezing eventlet's hub: under eventlet it runs in eventlet's pool of OS threads"""
+    if _eventlet_patched():
+        from eventlet import tpool
+        return tpool.execute(fn, *args)
+    return fn(*args)
+
+
+async def _run_blocking(fn, *args):
+    """Await fn, which blocks in C, from the Edge-TTS loop. Under eventlet the default
+    executor's workers are greenlets of the loop's thread, so use a real OS thread."""
+    loop = asyncio.get_running_loop()
+    if not _eventlet_patched():
+        return await loop.run_in_executor(None, fn, *args)
+    
+    fut = loop.create_future()
+    
+    def done(ok, value):
+        if fut.cancelled():
+            return
+        if ok:
+            fut.set_result(value)
+        else:
+            fut.set_exception(value)
+    
+    def run():
+        try:
+            result = (True, fn(*args))
+        except BaseException as e:
+            result = (False, e)
+        loop.call_soon_threadsafe(done, *result)
+    
+    _os_threading().Thread(target=run, daemon=True).start()
+    return await fut
+
+
+def _wav_ok(path, min_size=1000):
+    """True if path exists and is large enough to hold real audio (one stat call)"""
+    try:
+        return os.stat(path).st_size >= min_size
+    except FileNotFoundError:
+        return False
+
 
 class PiperTTS:
     def __init__(self):
@@ -26,6 +149,10 @@ class PiperTTS:
         self.current_language='en'
         self.bin, self.kind = self._find_piper_bin()
         
+        # Piper model discovery results per language dir (model files rarely change)
+        self._model_pair_cache = {}
+        self._model_single_cache = {}
+        
         # Edge-TTS configuration for all languages (male voices)
         self.edge_voices = {
             'en': 'en-US-GuyNeural',     # English male voice (US)
@@ -34,6 +161,44 @@ class PiperTTS:
         }
         self.temp_dir = Path('/tmp/edge_tts_audio')
         self.temp_dir.mkdir(exist_ok=True)
+        
+        # Persistent cache of synthesized Edge-TTS audio, keyed by SHA-256 of voice+text
+        self.cache_dir = self.temp_dir / "cache"
+        self.cache_dir.mkdir(exist_ok=True)
+        self.cache_max_entries = 200
+        self._cache_lock = threading.Lock()
+        self._cache_index = self._load_cache_index()  # key -> mtime, least recently used first
+        self._temp_seq = itertools.count()  # Unique suffixes for in-progress cache files
+        
+        # Last connectivity probe result: (monotonic time, available)
+        self._net_cache = (float('-inf'), False)
+        self.net_cache_ttl = 10.0
+        
+        # Player command lines, built once
+        self._aplay_base = ("aplay", "-q", "-D", SPK_PLUG)
+        self._aplay_raw_cmd = self._aplay_base + ("-t", "raw", "-f", "S16_LE", "-r", str(EDGE_TTS_RATE), "-c", "1")
+        self._mpg123_base = ("mpg123", "-q", "-s", "-m", "-r", str(EDGE_TTS_RATE), "-e", "s16")
+        
+        # Long-lived Piper processes keyed by command line: (Popen, lock)
+        self._piper_procs = OrderedDict()  # least recently used first
+        self._piper_procs_lock = threading.Lock()
+        # Command lines whose warm process has answered, and consecutive warm failures per command
+        self._piper_warm_ok = set()
+        self._piper_warm_failures = {}
+        
+        # ALSA PCM for Piper and Edge-TTS playback, kept open across the sentences of one
+        # utterance and released after it (SPK_PLUG is exclusive; the sound board needs it too)
+        self._pcm = None
+        self._pcm_params = None
+        # Only taken on real OS threads (PCM calls block in C), so it must be a real lock
+        self._pcm_lock = _os_threading().Lock()
+        
+        # Long-lived event loop for Edge-TTS coroutines (avoids asyncio.run per utterance).
+        # It needs a real OS thread: as a greenlet it would stay registered as the running
+        # loop of the server's only thread and break asyncio.run() everywhere else.
+        self._loop = asyncio.new_event_loop()
+        self._loop_thread = _os_threading().Thread(target=self._loop.run_forever, daemon=True)
+        self._loop_thread.start()
 
     def _find_piper_bin(self):
         # prefer piper-cli, then piper
@@ -55,91 +220,523 @@ class PiperTTS:
         return (None, None)
 
     def _find_model_pair(self, lang_dir):
+        if lang_dir in self._model_pair_cache:
+            return self._model_pair_cache[lang_dir]
         onnx = sorted(glob.glob(os.path.join(lang_dir, "*.onnx")))
         js   = sorted(glob.glob(os.path.join(lang_dir, "*.json")))
-        return (onnx[0], js[0]) if onnx and js else (None, None)
+        pair = (onnx[0], js[0]) if onnx and js else (None, None)
+        if pair[0]:
+            self._model_pair_cache[lang_dir] = pair
+        return pair
 
     def _find_model_single(self, lang_dir):
+        if lang_dir in self._model_single_cache:
+            return self._model_single_cache[lang_dir]
         onnx = sorted(glob.glob(os.path.join(lang_dir, "*.onnx")))
-        return onnx[0] if onnx else None
+        model = onnx[0] if onnx else None
+        if model:
+            self._model_single_cache[lang_dir] = model
+        return model
+
+    def invalidate_models(self):
+        """Forget discovered Piper models (call after adding/removing model files)"""
+        self._model_pair_cache.clear()
+        self._model_single_cache.clear()
 
     def _fix_romanian_question_intonation(self, text):
         """Fix Romanian question intonation by preprocessing text for Piper"""
-        # Remove the question mark temporarily
-        text_without_q = text.rstrip('?').strip()
+        # Remove the trailing question mark(s) and whitespace in one pass
+        core = text.rstrip('? \t\n')
         
-        # Different approaches for different question word patterns
-        question_words = ['ce', 'cum', 'unde', 'când', 'de ce', 'cine', 'care', 'cât', 'câte', 'câți', 'câteva']
-        
-        # Check if text contains common Romanian question words
-        text_lower = text_without_q.lower()
-        has_question_word = any(word in text_lower for word in question_words)
-        
-        if has_question_word:
-            # For questions with question words - add more emphasis and pause
-            enhanced_text = f"{text_without_q}... ?"
-        else:
-            # For other questions - simpler approach
-            enhanced_text = f"{text_without_q} ?"
-        
-        return enhanced_text
+        # Questions with question words get more emphasis and a pause,
+        # other questions a simpler approach (_Q_RE is case-insensitive)
+        return f"{core}... ?" if _Q_RE.search(core) else f"{core} ?"
 
     def internet_available(self):
-        """Check if internet connection is available"""
+        """Check if internet connection is available (TCP probe, cached for a few seconds)"""
+        checked_at, ok = self._net_cache
+        if time.monotonic() - checked_at < self.net_cache_ttl:
+            return ok
         try:
-            import urllib.request
-            urllib.request.urlopen('http://google.com', timeout=3)
-            return True
-        except:
+            socket.create_connection(("1.1.1.1", 53), timeout=0.25).close()
+            ok = True
+        except OSError:
+            ok = False
+        self._net_cache = (time.monotonic(), ok)
+        return ok
+
+    def _load_cache_index(self):
+        """Rebuild the LRU order of cached Edge-TTS files from their mtimes"""
+        entries = []
+        for f in self.cache_dir.glob("*.mp3"):
+            try:
+                entries.append((f.stat().st_mtime, f.stem))
+            except OSError:
+                pass
+        entries.sort()
+        return OrderedDict((key, mtime) for mtime, key in entries)
+
+    def _edge_cache_key(self, text, language):
+        voice = self.edge_voices[language]
+        return hashlib.sha256(f"{voice}|{text}".encode("utf-8")).hexdigest()
+
+    def _edge_cache_lookup(self, text, language):
+        """Return the cached Edge-TTS file for text, or None"""
+        if language not in self.edge_voices:
+            return None
+        key = self._edge_cache_key(text, language)
+        cached = self.cache_dir / f"{key}.mp3"
+        with self._cache_lock:
+            if key not in self._cache_index or not cached.exists():
+                self._cache_index.pop(key, None)
+                return None
+            self._cache_index[key] = time.time()
+            self._cache_index.move_to_end(key)
+        return str(cached)
+
+    def _edge_cache_store(self, key):
+        """Record a new cache entry and evict least recently used files over the cap"""
+        with self._cache_lock:
+            self._cache_index[key] = time.time()
+            self._cache_index.move_to_end(key)
+            while len(self._cache_index) > self.cache_max_entries:
+                old_key, _ = self._cache_index.popitem(last=False)
+                try:
+                    os.unlink(self.cache_dir / f"{old_key}.mp3")
+                except OSError:
+                    pass
+
+    def _start_mp3_player(self, mp3_file=None):
+        """Start an mpg123 -> aplay pipeline on the speaker device.
+        MP3 data is read from mp3_file, or written by the caller to decoder.stdin."""
+        decoder = subprocess.Popen(
+            self._mpg123_base + (mp3_file or '-',),
+            stdin=subprocess.DEVNULL if mp3_file else subprocess.PIPE,
+            stdout=subprocess.PIPE, stderr=subprocess.DEVNULL
+        )
+        player = subprocess.Popen(
+            self._aplay_raw_cmd,
+            stdin=decoder.stdout, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE
+        )
+        decoder.stdout.close()  # aplay owns the pipe now
+        return decoder, player
+
+    def _wait_mp3_player(self, decoder, player, timeout=60):
+        try:
+            player.wait(timeout=timeout)
+            decoder.wait(timeout=5)
+        except subprocess.TimeoutExpired:
+            decoder.kill()
+            player.kill()
+            log.warning("[TTS] Audio playback timed out")
+            return False
+        if player.returncode != 0:
+            log.warning("[TTS] aplay error: %s", player.stderr.read().decode('utf-8', 'ignore').strip())
+            return False
+        return decoder.returncode == 0
+
+    def _play_mp3_bytes(self, data):
+        """Decode MP3 data in-process and play it on the shared ALSA PCM"""
+        decoded = miniaudio.decode(
+            data, output_format=miniaudio.SampleFormat.SIGNED16,
+            nchannels=1, sample_rate=EDGE_TTS_RATE
+        )
+        pcm_data = decoded.samples.tobytes()
+        step = PCM_PERIOD_FRAMES * 2
+        self._write_pcm(EDGE_TTS_RATE, 1, 2,
+                        (pcm_data[i:i + step] for i in range(0, len(pcm_data), step)))
+
+    def play_edge_tts_audio(self, data):
+        """Play Edge-TTS MP3 data held in memory on the speaker device"""
+        if MINIAUDIO_AVAILABLE and ALSAAUDIO_AVAILABLE:
+            try:
+                self._play_mp3_bytes(data)
+                return True
+            except Exception as e:
+                log.warning("[TTS] In-process MP3 playback error: %s", e)
+        try:
+            decoder, player = self._start_mp3_player()
+            try:
+                decoder.stdin.write(data)
+            finally:
+                decoder.stdin.close()
+            return self._wait_mp3_player(decoder, player)
+        except Exception as e:
+            log.warning("[TTS] Audio playback error: %s", e)
+            return False
+
+    def play_edge_tts_file(self, audio_file):
+        """Play a cached Edge-TTS MP3 on the speaker device"""
+        if MINIAUDIO_AVAILABLE and ALSAAUDIO_AVAILABLE:
+            try:
+                self._play_mp3_bytes(Path(audio_file).read_bytes())
+                return True
+            except Exception as e:
+                log.warning("[TTS] In-process MP3 playback error: %s", e)
+        try:
+            decoder, player = self._start_mp3_player(str(audio_file))
+            return self._wait_mp3_player(decoder, player)
+        except Exception as e:
+            log.warning("[TTS] Audio playback error: %s", e)
             return False
 
     async def synthesize_edge_tts(self, text, language):
-        """High-quality Edge-TTS synthesis for all supported languages"""
-        if language not in self.edge_voices:
+        """Synthesize text with Edge-TTS and return the MP3 data, or None.
+        The audio is buffered in memory and also written to the cache."""
+        cached_file = self._edge_cache_lookup(text, language)
+        if cached_file:
+            try:
+                return Path(cached_file).read_bytes()
+            except OSError:
+                pass
+
+        key = self._edge_cache_key(text, language)
+        cached = self.cache_dir / f"{key}.mp3"
+        temp_file = self.cache_dir / f"{key}.{next(self._temp_seq)}.tmp"
+        try:
+            communicate = _get_edge_tts().Communicate(text, self.edge_voices[language])
+            buf = io.BytesIO()
+            async for chunk in communicate.stream():
+                if chunk["type"] == "audio":
+                    buf.write(chunk["data"])
+            data = buf.getvalue()
+            if not data:
+                return None
+            temp_file.write_bytes(data)
+            os.replace(temp_file, cached)
+            self._edge_cache_store(key)
+            return data
+        except Exception as e:
+            log.warning("[TTS] Edge-TTS error: %s", e)
+            try:
+                os.remove(temp_file)
+            except OSError:
+                pass
             return None
+
+    async def speak_edge_tts_sentences(self, sentences, language):
+        """Synthesize sentences concurrently (bounded) and play them in order.
+        Playback of sentence k starts as soon as it is ready, while later ones download.
+        Returns how many sentences were played, so a fallback can speak only the rest."""
+        sem = asyncio.Semaphore(EDGE_TTS_CONCURRENCY)
+        
+        async def synth(sentence):
+            async with sem:
+                return await self.synthesize_edge_tts(sentence, language)
+        
+        tasks = [asyncio.ensure_future(synth(sentence)) for sentence in sentences]
+        try:
+            for played, task in enumerate(tasks):
+                try:
+                    audio = await asyncio.wait_for(task, EDGE_TTS_SYNTH_TIMEOUT)
+                except asyncio.TimeoutError:
+                    log.warning("[TTS] Edge-TTS synthesis timed out")
+                    return played
+                if not audio:
+                    return played
+                if not await _run_blocking(self.play_edge_tts_audio, audio):
+                    return played
+            return len(tasks)
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def speak_edge_tts_streaming(self, text, language):
+        """Synthesize with Edge-TTS and play the audio chunks as they arrive.
+        The stream is also written to the cache for later replays."""
+        if language not in self.edge_voices:
+            return False
         
         voice = self.edge_voices[language]
-        temp_file = self.temp_dir / f"edge_tts_{language}_{int(time.time())}.mp3"
+        key = self._edge_cache_key(text, language)
+        cached = self.cache_dir / f"{key}.mp3"
+        temp_file = self.cache_dir / f"{key}.{next(self._temp_seq)}.tmp"
         
+        decoder, player = self._start_mp3_player()
+        received = False
         try:
-            communicate = edge_tts.Communicate(text, voice)
-            await communicate.save(str(temp_file))
-            return str(temp_file)
+            communicate = _get_edge_tts().Communicate(text, voice)
+            with open(temp_file, 'wb') as cache_out:
+                async def pump():
+                    nonlocal received
+                    async for chunk in communicate.stream():
+                        if chunk["type"] == "audio":
+                            decoder.stdin.write(chunk["data"])
+                            cache_out.write(chunk["data"])
+                            received = True
+                # Bound the synthesis only; playback is bounded by _wait_mp3_player
+                await asyncio.wait_for(pump(), EDGE_TTS_SYNTH_TIMEOUT)
+            if received:
+                os.replace(temp_file, cached)
+                self._edge_cache_store(key)
         except Exception as e:
-            print(f"[TTS] Edge-TTS error: {e}")
-            return None
+            # Stop a partly played sentence; the caller falls back for all of it
+            received = False
+            log.warning("[TTS] Edge-TTS error: %s", e)
+        finally:
+            try:
+                decoder.stdin.close()
+            except OSError:
+                pass
+            try:
+                os.remove(temp_file)
+            except OSError:
+                pass
+        
+        if not received:
+            decoder.kill()
+            player.kill()
+            return False
+        # Wait for playback off the loop so other coroutines keep running
+        return await _run_blocking(self._wait_mp3_player, decoder, player)
+
+    def _run_on_loop(self, coro, timeout):
+        """Run coro on the Edge-TTS loop and wait for its result.
+        Raises concurrent.futures.TimeoutError (after cancelling coro) on timeout."""
+        if not _eventlet_patched():
+            fut = asyncio.run_coroutine_threadsafe(coro, self._loop)
+            try:
+                return fut.result(timeout=timeout)
+            except concurrent.futures.TimeoutError:
+                fut.cancel()
+                raise
+        
+        # A concurrent.futures wake-up cannot cross from the loop's OS thread to a
+        # greenlet, so the result is handed over in a plain list and polled greenly
+        box = []
+        
+        async def run():
+            try:
+                box.append((True, await coro))
+            except BaseException as e:
+                box.append((False, e))
+        
+        fut = asyncio.run_coroutine_threadsafe(run(), self._loop)
+        deadline = time.monotonic() + timeout
+        while not box:
+            if time.monotonic() > deadline:
+                fut.cancel()
+                raise concurrent.futures.TimeoutError()
+            time.sleep(0.02)
+        ok, value = box[0]
+        if not ok:
+            raise value
+        return value
+
+    def close(self):
+        """Stop the background Edge-TTS event loop, warm Piper processes and speaker PCM"""
+        if self._loop.is_running():
+            self._loop.call_soon_threadsafe(self._loop.stop)
+        self._stop_piper_procs()
+        _offload(self._release_pcm)
 
-    def play_edge_tts_audio(self, audio_file):
-        """Play Edge-TTS audio using mpg123 with specific ALSA device"""
+    def __del__(self):
         try:
-            # Convert MP3 to WAV and play via aplay to use proper ALSA device
-            # First decode MP3 to WAV using mpg123
-            temp_wav = str(audio_file).replace('.mp3', '.wav')
-            decode_result = subprocess.run(
-                ['mpg123', '-q', '-w', temp_wav, str(audio_file)],
-                capture_output=True, timeout=30
+            self.close()
+        except Exception:
+            pass
+
+    def _get_pcm(self, rate, channels, sampwidth):
+        """Return an open ALSA PCM for the given format (caller holds _pcm_lock)"""
+        if sampwidth != 2:
+            raise ValueError(f"unsupported sample width {sampwidth}")
+        params = (rate, channels)
+        if self._pcm is None or self._pcm_params != params:
+            self._close_pcm()
+            self._pcm = alsaaudio.PCM(
+                alsaaudio.PCM_PLAYBACK, device=SPK_PLUG, channels=channels, rate=rate,
+                format=alsaaudio.PCM_FORMAT_S16_LE, periodsize=PCM_PERIOD_FRAMES
             )
-            
-            if decode_result.returncode != 0:
-                print(f"[TTS] MP3 decode failed: {decode_result.stderr.decode()}")
-                return False
-            
-            # Play WAV using aplay with proper ALSA device
-            play_result = subprocess.run(
-                ['aplay', '-q', '-D', SPK_PLUG, temp_wav],
-                capture_output=True, timeout=30
+            self._pcm_params = params
+        return self._pcm
+
+    def _close_pcm(self):
+        if self._pcm is not None:
+            try:
+                self._pcm.close()
+            except Exception:
+                pass
+        self._pcm = None
+        self._pcm_params = None
+
+    def _release_pcm(self):
+        """Let queued audio finish playing, then close the PCM so other players can open the device"""
+        with self._pcm_lock:
+            if self._pcm is not None and hasattr(self._pcm, 'drain'):
+                try:
+                    self._pcm.drain()
+                except Exception:
+                    pass
+            self._close_pcm()
+
+    def _write_pcm(self, rate, channels, sampwidth, chunks):
+        """Write PCM data chunks to the shared ALSA PCM.
+        Blocks in C for the length of the audio: call it through _offload from greenlets."""
+        with self._pcm_lock:
+            pcm = self._get_pcm(rate, channels, sampwidth)
+            for data in chunks:
+                pcm.write(data)
+
+    def _play_wav(self, wav_path):
+        """Play a WAV file on the speaker device. Returns an error message or None."""
+        if ALSAAUDIO_AVAILABLE:
+            try:
+                with wave.open(wav_path, 'rb') as w:
+                    self._write_pcm(w.getframerate(), w.getnchannels(), w.getsampwidth(),
+                                    iter(lambda: w.readframes(PCM_PERIOD_FRAMES), b''))
+                return None
+            except Exception as e:
+                log.warning("[TTS] ALSA playback failed (%s), falling back to aplay", e)
+                with self._pcm_lock:
+                    self._close_pcm()
+        
+        q = subprocess.run(self._aplay_base + (wav_path,), stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
+        if q.returncode!=0:
+            return f"aplay error: {q.stderr.strip()}"
+        return None
+
+    def _get_piper_proc(self, cmd):
+        """Return (process, lock) for a long-lived Piper reading JSON lines on stdin"""
+        key = tuple(cmd)
+        with self._piper_procs_lock:
+            entry = self._piper_procs.get(key)
+            if entry and entry[0].poll() is None:
+                self._piper_procs.move_to_end(key)
+                return entry
+            proc = subprocess.Popen(
+                cmd + ["--json-input"],
+                stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+                text=True, bufsize=1
             )
-            
-            # Clean up temp WAV
+            entry = (proc, threading.Lock())
+            self._piper_procs[key] = entry
+            self._piper_procs.move_to_end(key)
+            # Each process holds a model in memory: stop the least recently used idle ones
+            for old_key in list(self._piper_procs)[:-1]:
+                if len(self._piper_procs) <= PIPER_WARM_MAX_PROCS:
+                    break
+                old_proc, old_lock = self._piper_procs[old_key]
+                if not old_lock.acquire(blocking=False):
+                    continue  # Mid-synthesis; evicted on a later call
+                try:
+                    del self._piper_procs[old_key]
+                    if old_proc.poll() is None:
+                        old_proc.terminate()
+                finally:
+                    old_lock.release()
+            return entry
+
+    def _stop_piper_procs(self, cmd=None):
+        """Terminate the long-lived Piper process for cmd, or all of them"""
+        with self._piper_procs_lock:
+            keys = [tuple(cmd)] if cmd else list(self._piper_procs)
+            for key in keys:
+                entry = self._piper_procs.pop(key, None)
+                if entry and entry[0].poll() is None:
+                    entry[0].terminate()
+
+    @staticmethod
+    def _wait_wav_complete(path, timeout=2.0):
+        """Wait until the WAV at path holds all frames announced in its header"""
+        deadline = time.monotonic() + timeout
+        while True:
             try:
-                os.remove(temp_wav)
-            except:
+                with wave.open(path, 'rb') as w:
+                    expected = w.getnframes() * w.getsampwidth() * w.getnchannels()
+                if expected > 0 and os.stat(path).st_size >= 44 + expected:
+                    return True
+            except (OSError, EOFError, wave.Error):
                 pass
-            
-            return play_result.returncode == 0
+            if time.monotonic() > deadline:
+                return False
+            time.sleep(0.01)
+
+    def _piper_warm_synth(self, cmd, text, outwav):
+        """Synthesize one line into outwav using a long-lived Piper process, so the ONNX
+        model is loaded once instead of per utterance. Returns True on success.
+        After PIPER_WARM_MAX_FAILURES failures in a row the command is only run one-shot."""
+        key = tuple(cmd)
+        if self._piper_warm_failures.get(key, 0) >= PIPER_WARM_MAX_FAILURES:
+            return False
+        timeout = PIPER_WARM_TIMEOUT if key in self._piper_warm_ok else PIPER_WARM_FIRST_TIMEOUT
+        try:
+            proc, lock = self._get_piper_proc(cmd)
+            with lock:
+                proc.stdin.write(json.dumps({"text": text, "output_file": outwav}) + "\n")
+                proc.stdin.flush()
+                # Piper prints the output path once the file has been written
+                ready, _, _ = select.select([proc.stdout], [], [], timeout)
+                line = proc.stdout.readline() if ready else ""
+            if not line.strip():
+                raise RuntimeError("no response from piper")
+            if not self._wait_wav_complete(outwav):
+                raise RuntimeError("incomplete output from piper")
+            self._piper_warm_ok.add(key)
+            self._piper_warm_failures.pop(key, None)
+            return True
         except Exception as e:
-            print(f"[TTS] Audio playback error: {e}")
+            failures = self._piper_warm_failures.get(key, 0) + 1
+            self._piper_warm_failures[key] = failures
+            if failures >= PIPER_WARM_MAX_FAILURES:
+                log.warning("[TTS] Warm Piper failed (%s), using one-shot Piper from now on", e)
+            else:
+                log.warning("[TTS] Warm Piper failed (%s), using one-shot Piper for this sentence", e)
+            self._stop_piper_procs(cmd)
+            return False
+
+    def _speak_piper(self, cmd, text, fail_msg):
+        """Synthesize text sentence by sentence with Piper and play each WAV as soon as it
+        is ready, so synthesis of the next sentence overlaps playback of the current one.
+        Returns an error message or None."""
+        sentences = [part for part in _SENTENCE_RE.split(text) if part.strip()] or [text]
+        ready = queue.Queue(maxsize=2)
+        stop = threading.Event()
+        
+        def put(item):
+            while not stop.is_set():
+                try:
+                    ready.put(item, timeout=0.5)
+                    return True
+                except queue.Full:
+                    pass
             return False
+        
+        def producer():
+            for i, sentence in enumerate(sentences):
+                # Fixed per-position output files, reused across utterances
+                outwav = f"/tmp/tts_{i}.wav"
+                try:
+                    # Warm process first; one-shot Piper if it is unavailable
+                    if not self._piper_warm_synth(cmd, sentence, outwav):
+                        p = subprocess.run(
+                            cmd + ["--output_file", outwav],
+                            input=(sentence+"\n"), text=True,
+                            stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, check=False
+                        )
+                        if p.returncode!=0 or not _wav_ok(outwav):
+                            put((None, p.stderr or fail_msg))
+                            return
+                except Exception as e:
+                    put((None, f"tts error: {e}"))
+                    return
+                if not put((outwav, None)):
+                    return
+            put((None, None))
+        
+        threading.Thread(target=producer, daemon=True).start()
+        try:
+            while True:
+                outwav, err = ready.get(timeout=120)
+                if outwav is None:
+                    return err
+                # The file is kept and overwritten by the next utterance (no create/unlink churn)
+                err = _offload(self._play_wav, outwav)
+                if err:
+                    return err
+        except queue.Empty:
+            return fail_msg
+        finally:
+            stop.set()
 
     def status(self):
         return {
@@ -150,6 +747,13 @@ class PiperTTS:
         }
 
     def speak(self, text, language=None):
+        try:
+            return self._speak(text, language)
+        finally:
+            # Never hold the exclusive speaker device between utterances
+            _offload(self._release_pcm)
+
+    def _speak(self, text, language=None):
         text = (text or "").strip()
         if not text:
             return {"ok": False, "msg": "empty text"}
@@ -161,25 +765,34 @@ class PiperTTS:
         if self.current_language in self.edge_voices and self.internet_available():
             try:
                 lang_name = self.languages[self.current_language]['name']
-                print(f"[TTS] Using Edge-TTS for {lang_name}: {text}")
-                audio_file = asyncio.run(self.synthesize_edge_tts(text, self.current_language))
-                
-                if audio_file and os.path.exists(audio_file):
-                    success = self.play_edge_tts_audio(audio_file)
-                    # Clean up temp file
-                    try:
-                        os.remove(audio_file)
-                    except:
-                        pass
-                    
-                    if success:
-                        return {"ok": True, "msg": f"Spoken with Edge-TTS ({lang_name})"}
-                    else:
-                        print("[TTS] Edge-TTS playback failed, falling back to Piper")
+                log.debug("[TTS] Using Edge-TTS for %s: %s", lang_name, text)
+                # Cache hits skip synthesis entirely
+                cached_file = self._edge_cache_lookup(text, self.current_language)
+                sentences = [part for part in _SENTENCE_RE.split(text) if part.strip()] or [text]
+                if cached_file:
+                    played = len(sentences) if _offload(self.play_edge_tts_file, cached_file) else 0
                 else:
-                    print("[TTS] Edge-TTS synthesis failed, falling back to Piper")
+                    # Decoding in-process needs the whole MP3, so the sentence path is used
+                    # even for one sentence; mpg123 can start playing mid-stream instead
+                    if len(sentences) > 1 or (MINIAUDIO_AVAILABLE and ALSAAUDIO_AVAILABLE):
+                        coro = self.speak_edge_tts_sentences(sentences, self.current_language)
+                    else:
+                        # Single sentence: success counts as that one sentence played
+                        coro = self.speak_edge_tts_streaming(text, self.current_language)
+                    try:
+                        played = int(self._run_on_loop(coro, EDGE_TTS_UTTERANCE_TIMEOUT))
+                    except concurrent.futures.TimeoutError:
+                        # Audio may still be playing; a Piper fallback would talk over it
+                        return {"ok": False, "msg": "Edge-TTS playback timed out"}
+                
+                if played == len(sentences):
+                    return {"ok": True, "msg": f"Spoken with Edge-TTS ({lang_name})"}
+                # Only what Edge-TTS did not get to is spoken again
+                log.warning("[TTS] Edge-TTS failed after %d of %d sentences, falling back to Piper",
+                            played, len(sentences))
+                text = " ".join(sentences[played:])
             except Exception as e:
-                print(f"[TTS] Edge-TTS error: {e}, falling back to Piper")
+                log.warning("[TTS] Edge-TTS error: %s, falling back to Piper", e)
         
         # Fix Romanian question intonation for Piper fallback
         is_romanian_question = self.current_language == 'ro' and text.endswith('?')
@@ -192,25 +805,15 @@ class PiperTTS:
             model, cfg = self._find_model_pair(lang_dir)
             if not model or not cfg:
                 return {"ok": False, "msg": f"no Piper model/cfg in {lang_dir}"}
-            outwav = "/tmp/tts.wav"
             try:
                 # Add length scale for Romanian questions to improve intonation
-                cmd = [self.bin, "--model", model, "--config", cfg, "--output_file", outwav]
+                cmd = [self.bin, "--model", model, "--config", cfg]
                 if is_romanian_question:
                     cmd.extend(["--length_scale", "0.8"])  # Slower speech for questions
                 
-                p = subprocess.run(
-                    cmd,
-                    input=(text+"\n"), text=True,
-                    stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, check=False
-                )
-                if p.returncode!=0 or not os.path.exists(outwav) or os.path.getsize(outwav)<1000:
-                    return {"ok": False, "msg": (p.stderr.decode() if hasattr(p.stderr,'decode') else p.stderr) or "piper-cli failed"}
-                # play
-                q = subprocess.run(["aplay","-q","-D", SPK_PLUG, outwav], stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
-                os.unlink(outwav)
-                if q.returncode!=0:
-                    return {"ok": False, "msg": f"aplay error: {q.stderr.strip()}"}
+                err = self._speak_piper(cmd, text, "piper-cli failed")
+                if err:
+                    return {"ok": False, "msg": err}
                 return {"ok": True, "msg": f"Spoken ({self.languages[self.current_language]['name']})"}
             except Exception as e:
                 return {"ok": False, "msg": f"tts error: {e}"}
@@ -220,24 +823,15 @@ class PiperTTS:
             model = self._find_model_single(lang_dir)
             if not model:
                 return {"ok": False, "msg": f"no Piper model in {lang_dir}"}
-            outwav = "/tmp/tts.wav"
             try:
                 # Add length scale for Romanian questions to improve intonation
-                cmd = [self.bin, "--model", model, "--output_file", outwav]
+                cmd = [self.bin, "--model", model]
                 if is_romanian_question:
                     cmd.extend(["--length_scale", "0.8"])  # Slower speech for questions
                 
-                p = subprocess.run(
-                    cmd,
-                    input=(text+"\n"), text=True,
-                    stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, check=False
-                )
-                if p.returncode!=0 or not os.path.exists(outwav) or os.path.getsize(outwav)<1000:
-                    return {"ok": False, "msg": (p.stderr.decode() if hasattr(p.stderr,'decode') else p.stderr) or "piper failed"}
-                q = subprocess.run(["aplay","-q","-D", SPK_PLUG, outwav], stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
-                os.unlink(outwav)
-                if q.returncode!=0:
-                    return {"ok": False, "msg": f"aplay error: {q.stderr.strip()}"}
+                err = self._speak_piper(cmd, text, "piper failed")
+                if err:
+                    return {"ok": False, "msg": err}
                 return {"ok": True, "msg": f"Spoken ({self.languages[self.current_language]['name']})"}
             except Exception as e:
                 return {"ok": False, "msg": f"tts error: {e}"}
@@ -245,7 +839,7 @@ class PiperTTS:
         # 3) Fallback: espeak-ng -> aplay
         try:
             es = subprocess.Popen(["espeak-ng","-v","en-us","-s","170","--stdout", text], stdout=subprocess.PIPE)
-            ap = subprocess.Popen(["aplay","-q","-D", SPK_PLUG], stdin=es.stdout, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=False)
+            ap = subprocess.Popen(self._aplay_base, stdin=es.stdout, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=False)
             es.stdout.close()
             ap.wait(timeout=20); es.wait(timeout=20)
             if ap.returncode!=0:
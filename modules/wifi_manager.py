@@ -1,10 +1,43 @@
 import os
+import re
 import json
 import threading
 import time
+import shutil
+import types
+import selectors
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+try:
+    # Optional: query NetworkManager over D-Bus (libnm) instead of forking nmcli
+    import gi
+    gi.require_version('NM', '1.0')
+    from gi.repository import GLib, NM
+    NM_AVAILABLE = True
+except (ImportError, ValueError):
+    NM_AVAILABLE = False
+
+
+# nmcli terse output (-t): fields end at an unescaped ':'; a backslash escapes ':' and itself
+_TERSE_RE = re.compile(rb'((?:[^:\\]|\\.)*):')
+_UNESCAPE_RE = re.compile(rb'\\(.)')
+
+# `iw dev` / `iw dev <iface> scan` output
+_IW_IFACE_RE = re.compile(rb'^\s*Interface\s+(\S+)', re.M)
+_IW_SSID_RE = re.compile(rb'^\s*SSID: ?(.*)$', re.M)
+_IW_SIGNAL_RE = re.compile(rb'^\s*signal:\s*(-?[\d.]+) dBm', re.M)
+
+
+def _text(raw: bytes) -> str:
+    return raw.decode('utf-8', 'replace')
+
+
+def _terse_fields(line: bytes) -> list[bytes]:
+    """Split a line of nmcli terse output into unescaped fields."""
+    return [_UNESCAPE_RE.sub(rb'\1', f) if b'\\' in f else f for f in _TERSE_RE.findall(line + b':')]
+
 
 class WifiManager:
     """Simple Wi-Fi manager using nmcli when available, with preference handling and auto-selection.
@@ -13,18 +46,55 @@ class WifiManager:
     - Preferences are stored in config/wifi.json.
     - If nmcli is not available, scanning falls back to iw utilities where possible.
     - Connecting requires nmcli; otherwise a helpful error is returned.
+    - With libnm (PyGObject) installed, status and scans read NetworkManager over D-Bus.
     """
 
     def __init__(self, config_dir: str):
         self.config_dir = Path(config_dir)
         self.config_dir.mkdir(parents=True, exist_ok=True)
         self.config_path = self.config_dir / 'wifi.json'
-        self._lock = threading.Lock()
+        # self._state is an immutable snapshot replaced wholesale on every change,
+        # so readers use it without locking; the lock only serializes writers
+        self._write_lock = threading.Lock()
+        # Bumped after every published change; keys the cached known_networks summary
+        self._state_version = 0
+        self._known_summary: tuple[int, dict] = (-1, {})
+        # State edits are coalesced and written once after a short quiet period
+        self._dirty = False
+        self._flush_timer: threading.Timer | None = None
+        # Resolved once: a PATH walk instead of forking `which` on every call
+        self._nmcli = shutil.which('nmcli')
+        self._iface: str | None = None  # cached Wi-Fi device, reset when a connection fails
         self._load_state()
+        # Last scan result, reused by the auto-manager until it is _scan_ttl seconds old
+        self._scan_cache: list[dict] = []
+        self._scan_cache_ts = float('-inf')
+        self._scan_ttl = 15.0
+        self._scan_lock = threading.Lock()
+        # Independent nmcli queries are issued in parallel
+        self._executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix='WifiNmcli')
+        self._nm = None
+        self._nm_lock = threading.Lock()  # libnm objects are not thread-safe
+        if NM_AVAILABLE:
+            try:
+                self._nm = NM.Client.new(None)
+            except Exception:
+                self._nm = None
         self._stop_event = threading.Event()
         self._thread = None
 
     # ---------- Persistence ----------
+    @staticmethod
+    def _freeze(state: dict) -> types.MappingProxyType:
+        # Nested values are never mutated after publishing; lists become tuples
+        return types.MappingProxyType({**state, 'preferred_order': tuple(state.get('preferred_order', ()))})
+
+    def _publish(self, state: dict) -> None:
+        """Replace the state snapshot and schedule a save. Caller holds _write_lock."""
+        self._state = self._freeze(state)
+        self._state_version += 1
+        self._schedule_save()
+
     def _load_state(self) -> None:
         default_state = {
             'auto_manage': True,
@@ -34,191 +104,371 @@ class WifiManager:
         try:
             if self.config_path.exists():
                 with open(self.config_path, 'r') as f:
-                    self.state = json.load(f)
+                    self._state = self._freeze(json.load(f))
             else:
-                self.state = default_state
-                self._save_state()
+                self._state = self._freeze(default_state)
+                self._save_state_now()
         except Exception:
-            self.state = default_state
+            self._state = self._freeze(default_state)
 
-    def _save_state(self) -> None:
+    def _save_state_now(self) -> None:
         tmp = self.config_path.with_suffix('.tmp')
         with open(tmp, 'w') as f:
-            json.dump(self.state, f, indent=2)
+            json.dump(dict(self._state), f, indent=2)
         os.replace(tmp, self.config_path)
 
+    def _schedule_save(self) -> None:
+        """Mark state dirty and (re)arm the write timer. Caller holds _write_lock."""
+        self._dirty = True
+        if self._flush_timer:
+            self._flush_timer.cancel()
+        # Non-daemon so a pending write still lands on interpreter exit
+        self._flush_timer = threading.Timer(0.5, self._flush_if_dirty)
+        self._flush_timer.start()
+
+    def _flush_if_dirty(self) -> None:
+        with self._write_lock:
+            if self._dirty:
+                self._dirty = False
+                self._save_state_now()
+
     # ---------- Utilities ----------
-    @staticmethod
-    def _has_nmcli() -> bool:
-        return subprocess.run(['which', 'nmcli'], capture_output=True).returncode == 0
+    def _has_nmcli(self) -> bool:
+        return self._nmcli is not None
 
     @staticmethod
     def _run(cmd: list[str], timeout: int = 5) -> subprocess.CompletedProcess:
-        return subprocess.run(cmd, capture_output=True, text=True, timeout=timeout)
+        # Output stays bytes; parsers split the raw buffer and decode only the fields they keep
+        return WifiManager._execute(cmd, timeout)
+
+    @staticmethod
+    def _execute(cmd: list[str], timeout: float) -> subprocess.CompletedProcess:
+        """Run cmd, draining stdout and stderr with one selector loop until EOF or timeout."""
+        proc = subprocess.Popen(cmd, stdin=subprocess.DEVNULL, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+        output = {proc.stdout: [], proc.stderr: []}
+        deadline = time.monotonic() + timeout
+        try:
+            with selectors.DefaultSelector() as sel:
+                for pipe in output:
+                    sel.register(pipe, selectors.EVENT_READ)
+                while sel.get_map():
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        raise subprocess.TimeoutExpired(cmd, timeout)
+                    for key, _ in sel.select(remaining):
+                        data = os.read(key.fd, 65536)
+                        if data:
+                            output[key.fileobj].append(data)
+                        else:
+                            sel.unregister(key.fileobj)
+            returncode = proc.wait(max(0.0, deadline - time.monotonic()))
+        except subprocess.TimeoutExpired:
+            proc.kill()
+            proc.wait()
+            raise
+        finally:
+            proc.stdout.close()
+            proc.stderr.close()
+        return subprocess.CompletedProcess(cmd, returncode, b''.join(output[proc.stdout]), b''.join(output[proc.stderr]))
 
     def _wifi_iface(self) -> str | None:
+        if self._iface:
+            return self._iface
+        if self._nm is not None:
+            try:
+                with self._nm_lock:
+                    dev = self._nm_wifi_device()
+                    if dev is not None:
+                        self._iface = dev.get_iface()
+                        return self._iface
+            except Exception:
+                pass
         try:
             res = self._run(['nmcli', '-t', '-f', 'DEVICE,TYPE,STATE', 'device', 'status'])
             if res.returncode == 0:
-                for line in res.stdout.splitlines():
-                    parts = (line or '').split(':')
-                    if len(parts) >= 3 and parts[1] == 'wifi':
-                        return parts[0]
+                for line in res.stdout.split(b'\n'):
+                    parts = _terse_fields(line)
+                    if len(parts) >= 3 and parts[1] == b'wifi':
+                        self._iface = _text(parts[0])
+                        return self._iface
         except Exception:
             pass
         return None
 
+    def _iw_scan(self) -> list[dict]:
+        """Scan with `iw` directly (no NetworkManager); signal is mapped from dBm to nmcli's 0-100 scale."""
+        iface = self._iface
+        if not iface:
+            res = self._run(['iw', 'dev'])
+            m = _IW_IFACE_RE.search(res.stdout) if res.returncode == 0 else None
+            if not m:
+                return []
+            iface = self._iface = _text(m.group(1))
+        res = self._run(['iw', 'dev', iface, 'scan'], timeout=10)
+        if res.returncode != 0:
+            # Triggering a scan needs CAP_NET_ADMIN; fall back to the kernel's cached results
+            res = self._run(['iw', 'dev', iface, 'scan', 'dump'], timeout=10)
+            if res.returncode != 0:
+                return []
+        best: dict[str, int | None] = {}
+        for bss in res.stdout.split(b'\nBSS '):
+            ssid_m = _IW_SSID_RE.search(bss)
+            if not ssid_m or not ssid_m.group(1):
+                continue
+            sig_m = _IW_SIGNAL_RE.search(bss)
+            sig = max(0, min(100, 2 * (int(float(sig_m.group(1))) + 100))) if sig_m else None
+            ssid = _text(ssid_m.group(1))
+            if ssid not in best or (sig is not None and (best[ssid] is None or sig > best[ssid])):
+                best[ssid] = sig
+        return [{'ssid': ssid, 'signal': sig, 'security': ''} for ssid, sig in best.items()]
+
+    # ---------- NetworkManager D-Bus (libnm) ----------
+    def _nm_refresh(self) -> None:
+        # libnm updates its object cache from D-Bus signals dispatched on the main context
+        ctx = GLib.MainContext.default()
+        while ctx.pending():
+            ctx.iteration(False)
+
+    def _nm_wifi_device(self):
+        self._nm_refresh()
+        for dev in self._nm.get_devices():
+            if dev.get_device_type() == NM.DeviceType.WIFI:
+                return dev
+        return None
+
+    @staticmethod
+    def _nm_ssid(ap) -> str | None:
+        ssid = ap.get_ssid()
+        return NM.utils_ssid_to_utf8(ssid.get_data()) if ssid else None
+
+    @staticmethod
+    def _nm_security(ap) -> str:
+        # Same labels as `nmcli -f security dev wifi list`
+        flags, wpa, rsn = ap.get_flags(), ap.get_wpa_flags(), ap.get_rsn_flags()
+        sec = []
+        if flags & getattr(NM, '80211ApFlags').PRIVACY and not wpa and not rsn:
+            sec.append('WEP')
+        if wpa:
+            sec.append('WPA1')
+        if rsn:
+            sec.append('WPA3' if rsn & getattr(NM, '80211ApSecurityFlags').KEY_MGMT_SAE else 'WPA2')
+        if (wpa | rsn) & getattr(NM, '80211ApSecurityFlags').KEY_MGMT_802_1X:
+            sec.append('802.1X')
+        return ' '.join(sec)
+
+    def _nm_status(self) -> tuple[str | None, int | None, str | None]:
+        with self._nm_lock:
+            connected_ssid = signal = ip4 = None
+            dev = self._nm_wifi_device()
+            ap = dev.get_active_access_point() if dev is not None else None
+            if ap is not None:
+                connected_ssid = self._nm_ssid(ap)
+                signal = ap.get_strength()
+            # First IPv4 address in device order, like `nmcli device show`
+            for d in self._nm.get_devices():
+                cfg = d.get_ip4_config()
+                addrs = cfg.get_addresses() if cfg is not None else []
+                if addrs:
+                    ip4 = addrs[0].get_address()
+                    break
+            return connected_ssid, signal, ip4
+
+    def _nm_scan(self) -> list[dict]:
+        with self._nm_lock:
+            dev = self._nm_wifi_device()
+            if dev is None:
+                return []
+            # LastScan (libnm >= 1.24) advances when the requested scan has completed
+            last_scan = getattr(dev, 'get_last_scan', None)
+            before = last_scan() if last_scan else None
+            dev.request_scan_async(None, None, None)
+            deadline = time.monotonic() + 1.0
+            while time.monotonic() < deadline:
+                time.sleep(0.05)
+                self._nm_refresh()
+                if before is not None and last_scan() > before:
+                    break
+            networks = []
+            seen = set()
+            # Strongest first so the first sighting of an SSID is kept, as with nmcli
+            for ap in sorted(dev.get_access_points(), key=lambda a: -a.get_strength()):
+                ssid = self._nm_ssid(ap)
+                if not ssid or ssid in seen:
+                    continue
+                seen.add(ssid)
+                networks.append({'ssid': ssid, 'signal': ap.get_strength(), 'security': self._nm_security(ap)})
+            return networks
+
+    def _nm_current_ssid(self) -> str | None:
+        with self._nm_lock:
+            dev = self._nm_wifi_device()
+            ap = dev.get_active_access_point() if dev is not None else None
+            return self._nm_ssid(ap) if ap is not None else None
+
     # ---------- Public API ----------
+    def _known_networks_summary(self) -> dict:
+        """Known networks without secrets, rebuilt only after the state changes.
+        The returned dict is shared between callers and must not be mutated."""
+        # Read the version before the state: a stale pairing only causes a rebuild
+        version = self._state_version
+        cached_version, summary = self._known_summary
+        if cached_version != version:
+            known = self._state.get('known_networks', {})
+            summary = {k: {'has_psk': bool(v.get('psk'))} for k, v in known.items()}
+            self._known_summary = (version, summary)
+        return summary
+
     def status(self) -> dict:
-        with self._lock:
-            connected_ssid = None
-            signal = None
-            ip4 = None
-            backend = 'nmcli' if self._has_nmcli() else 'iw'
-            try:
-                if self._has_nmcli():
-                    # Current connection
-                    res = self._run(['nmcli', '-t', '-f', 'active,ssid,signal,device', 'dev', 'wifi'])
-                    if res.returncode == 0:
-                        for line in res.stdout.splitlines():
-                            parts = line.split(':')
-                            if len(parts) >= 4 and parts[0] == 'yes':
-                                connected_ssid = parts[1] or None
-                                try:
-                                    signal = int(parts[2]) if parts[2] else None
-                                except Exception:
-                                    signal = None
-                                break
-                    ipres = self._run(['nmcli', '-t', '-f', 'ip4.address', 'device', 'show'])
-                    if ipres.returncode == 0:
-                        for line in ipres.stdout.splitlines():
-                            if line.strip().startswith('IP4.ADDRESS') or line.strip().startswith('IP4.ADDRESS[1]'):
-                                ip4 = line.split(':', 1)[1].split('/')[0].strip()
-                                break
-                else:
-                    # Fallback: iwgetid for SSID
-                    ssid_res = self._run(['iwgetid', '-r'])
-                    if ssid_res.returncode == 0:
-                        connected_ssid = (ssid_res.stdout or '').strip() or None
-            except Exception:
-                pass
+        state = self._state
+        auto_manage = state.get('auto_manage', True)
+        preferred_order = list(state.get('preferred_order', ()))
+        known_networks = self._known_networks_summary()
 
-            return {
-                'connected_ssid': connected_ssid,
-                'signal': signal,
-                'ip4': ip4,
-                'backend': backend,
-                'auto_manage': self.state.get('auto_manage', True),
-                'preferred_order': list(self.state.get('preferred_order', [])),
-                'known_networks': {k: {'has_psk': bool(v.get('psk'))} for k, v in self.state.get('known_networks', {}).items()}
-            }
-
-    def scan(self) -> list[dict]:
+        connected_ssid = None
+        signal = None
+        ip4 = None
+        has_nmcli = self._has_nmcli()
+        backend = 'nmcli' if has_nmcli else 'iw'
+        try:
+            if self._nm is not None:
+                backend = 'dbus'
+                connected_ssid, signal, ip4 = self._nm_status()
+            elif has_nmcli:
+                # Current connection and IP address, queried concurrently
+                wifi_fut = self._executor.submit(self._run, ['nmcli', '-t', '-f', 'active,ssid,signal,device', 'dev', 'wifi'])
+                ip_fut = self._executor.submit(self._run, ['nmcli', '-t', '-f', 'ip4.address', 'device', 'show'])
+                res = wifi_fut.result()
+                if res.returncode == 0:
+                    for line in res.stdout.split(b'\n'):
+                        parts = _terse_fields(line)
+                        if len(parts) >= 4 and parts[0] == b'yes':
+                            connected_ssid = _text(parts[1]) or None
+                            try:
+                                signal = int(parts[2]) if parts[2] else None
+                            except Exception:
+                                signal = None
+                            break
+                ipres = ip_fut.result()
+                if ipres.returncode == 0:
+                    for line in ipres.stdout.split(b'\n'):
+                        if line.startswith(b'IP4.ADDRESS'):
+                            ip4 = _text(line.partition(b':')[2].partition(b'/')[0].strip())
+                            break
+            else:
+                # Fallback: iwgetid for SSID
+                ssid_res = self._run(['iwgetid', '-r'])
+                if ssid_res.returncode == 0:
+                    connected_ssid = _text(ssid_res.stdout.strip()) or None
+        except Exception:
+            pass
+
+        return {
+            'connected_ssid': connected_ssid,
+            'signal': signal,
+            'ip4': ip4,
+            'backend': backend,
+            'auto_manage': auto_manage,
+            'preferred_order': preferred_order,
+            'known_networks': known_networks
+        }
+
+    def scan(self, force: bool = False) -> list[dict]:
+        """List visible networks, strongest first. A recent result is reused unless force is set."""
+        with self._scan_lock:
+            if not force and time.monotonic() - self._scan_cache_ts < self._scan_ttl:
+                return list(self._scan_cache)
         networks: list[dict] = []
         try:
-            if self._has_nmcli():
-                # Trigger a fresh rescan on the Wi‑Fi interface if available for fuller results
+            if self._nm is not None:
+                networks = self._nm_scan()
+            elif self._has_nmcli():
+                # --rescan yes makes nmcli trigger a fresh scan and wait for it to finish
+                cmd = ['nmcli', '-t', '-f', 'ssid,signal,security', 'dev', 'wifi', 'list', '--rescan', 'yes']
                 iface = self._wifi_iface()
                 if iface:
-                    self._run(['nmcli', 'device', 'wifi', 'rescan', 'ifname', iface], timeout=10)
-                else:
-                    self._run(['nmcli', 'device', 'wifi', 'rescan'], timeout=10)
-                time.sleep(1.0)
-                res = self._run(['nmcli', '-t', '-f', 'ssid,signal,security', 'dev', 'wifi', 'list'], timeout=10)
+                    cmd += ['ifname', iface]
+                res = self._run(cmd, timeout=20)
                 if res.returncode == 0:
                     seen = set()
-                    for line in res.stdout.splitlines():
-                        parts = line.split(':')
+                    for line in res.stdout.split(b'\n'):
+                        parts = _terse_fields(line)
                         if len(parts) >= 3:
-                            ssid = parts[0]
-                            if not ssid or ssid in seen:
+                            raw_ssid = parts[0]
+                            if not raw_ssid or raw_ssid in seen:
                                 continue
-                            seen.add(ssid)
+                            seen.add(raw_ssid)
                             try:
                                 sig = int(parts[1]) if parts[1] else None
                             except Exception:
                                 sig = None
-                            security = parts[2] or ''
+                            ssid = _text(raw_ssid)
+                            security = _text(parts[2])
                             networks.append({'ssid': ssid, 'signal': sig, 'security': security})
             else:
-                # Try iwlist scan
-                res = self._run(['bash', '-lc', "iwlist $(iw dev | awk '/Interface/ {print $2; exit}') scan 2>/dev/null | egrep 'ESSID|Signal level'"], timeout=10)
-                if res.returncode == 0:
-                    ssid = None
-                    for line in res.stdout.splitlines():
-                        line = line.strip()
-                        if 'ESSID' in line:
-                            ssid = line.split(':', 1)[1].strip().strip('"')
-                        elif 'Signal level' in line and ssid:
-                            networks.append({'ssid': ssid, 'signal': None, 'security': ''})
-                            ssid = None
+                networks = self._iw_scan()
         except Exception:
             pass
         # Sort by signal descending where available
         networks.sort(key=lambda x: (x['signal'] is None, -(x['signal'] or 0)))
-        return networks
+        with self._scan_lock:
+            self._scan_cache = networks
+            self._scan_cache_ts = time.monotonic()
+        return list(networks)
 
     def scan_full(self) -> list[dict]:
         """Perform a full scan by briefly disconnecting and rescanning, then restoring connection."""
         if not self._has_nmcli():
-            return self.scan()
-        iface = self._wifi_iface()
+            return self.scan(force=True)
         active_name = None
         try:
             cres = self._run(['nmcli', '-t', '-f', 'NAME,TYPE,DEVICE,ACTIVE', 'connection', 'show', '--active'], timeout=10)
             if cres.returncode == 0:
-                for line in cres.stdout.splitlines():
-                    name, ctype, dev, active = (line.split(':') + ['','','',''])[:4]
-                    if ctype == 'wifi' and active == 'yes':
-                        active_name = name
+                for line in cres.stdout.split(b'\n'):
+                    parts = _terse_fields(line)
+                    if len(parts) >= 4 and parts[1] == b'wifi' and parts[3] == b'yes':
+                        active_name = _text(parts[0])
                         break
             if active_name:
+                # nmcli returns once the connection is deactivated
                 self._run(['nmcli', 'connection', 'down', active_name], timeout=10)
-                time.sleep(2)
-            if iface:
-                self._run(['nmcli', 'device', 'wifi', 'rescan', 'ifname', iface], timeout=10)
-            else:
-                self._run(['nmcli', 'device', 'wifi', 'rescan'], timeout=10)
-            time.sleep(2)
-            nets = self.scan()
+            # The forced scan rescans and waits for completion
+            nets = self.scan(force=True)
         finally:
             if active_name:
                 self._run(['nmcli', 'connection', 'up', active_name], timeout=15)
         return nets
 
     def set_auto(self, enabled: bool) -> dict:
-        with self._lock:
-            self.state['auto_manage'] = bool(enabled)
-            self._save_state()
-            return {'ok': True, 'auto_manage': self.state['auto_manage']}
+        with self._write_lock:
+            self._publish({**self._state, 'auto_manage': bool(enabled)})
+            return {'ok': True, 'auto_manage': self._state['auto_manage']}
 
     def prefer(self, ssid: str) -> dict:
         if not ssid:
             return {'ok': False, 'msg': 'Missing ssid'}
-        with self._lock:
-            order = [s for s in self.state.get('preferred_order', []) if s != ssid]
+        with self._write_lock:
+            order = [s for s in self._state.get('preferred_order', ()) if s != ssid]
             order.insert(0, ssid)
-            self.state['preferred_order'] = order
-            self._save_state()
+            self._publish({**self._state, 'preferred_order': order})
             return {'ok': True, 'preferred_order': order}
 
     def set_priorities(self, ssids: list[str]) -> dict:
-        with self._lock:
+        with self._write_lock:
             # Keep only unique, non-empty
             clean = []
             for s in ssids:
                 if s and s not in clean:
                     clean.append(s)
-            self.state['preferred_order'] = clean
-            self._save_state()
+            self._publish({**self._state, 'preferred_order': clean})
             return {'ok': True, 'preferred_order': clean}
 
     def save_known(self, ssid: str, psk: str | None) -> None:
-        with self._lock:
-            self.state.setdefault('known_networks', {})[ssid] = {'psk': psk or ''}
-            if ssid not in self.state.setdefault('preferred_order', []):
-                self.state['preferred_order'].append(ssid)
-            self._save_state()
+        with self._write_lock:
+            known = {**self._state.get('known_networks', {}), ssid: {'psk': psk or ''}}
+            order = self._state.get('preferred_order', ())
+            if ssid not in order:
+                order += (ssid,)
+            self._publish({**self._state, 'known_networks': known, 'preferred_order': order})
 
     def connect(self, ssid: str, psk: str | None = None) -> dict:
         if not self._has_nmcli():
@@ -230,9 +480,9 @@ class WifiManager:
             con_list = self._run(['nmcli', '-t', '-f', 'NAME,TYPE', 'connection', 'show'])
             has_profile = False
             if con_list.returncode == 0:
-                for line in con_list.stdout.splitlines():
-                    name, _, = (line.split(':') + [''])[:2]
-                    if name == ssid:
+                raw_ssid = ssid.encode()
+                for line in con_list.stdout.split(b'\n'):
+                    if _terse_fields(line)[0] == raw_ssid:
                         has_profile = True
                         break
             if has_profile:
@@ -248,9 +498,11 @@ class WifiManager:
             if res.returncode == 0:
                 # Save credentials locally for auto-manage
                 self.save_known(ssid, psk)
-                return {'ok': True, 'msg': res.stdout.strip() or 'Connected'}
-            return {'ok': False, 'msg': res.stderr.strip() or res.stdout.strip() or 'Connection failed'}
+                return {'ok': True, 'msg': _text(res.stdout.strip()) or 'Connected'}
+            self._iface = None  # the device may have changed (e.g. USB dongle replugged)
+            return {'ok': False, 'msg': _text(res.stderr.strip() or res.stdout.strip()) or 'Connection failed'}
         except Exception as e:
+            self._iface = None
             return {'ok': False, 'msg': str(e)}
 
     # ---------- Background Auto-Manager ----------
@@ -265,64 +517,68 @@ class WifiManager:
         self._stop_event.set()
         if self._thread:
             self._thread.join(timeout=2)
+        with self._write_lock:
+            if self._flush_timer:
+                self._flush_timer.cancel()
+        self._flush_if_dirty()
 
     def _best_available(self) -> str | None:
-        scan = self.scan()
+        scan = self.scan(force=False)
         if not scan:
             return None
-        available_by_ssid = {n['ssid']: n for n in scan if n.get('ssid')}
+        available = {n['ssid'] for n in scan if n.get('ssid')}
         # Choose first preferred that is available; otherwise strongest open
-        for ssid in self.state.get('preferred_order', []):
-            if ssid in available_by_ssid:
-                return ssid
-        # No preferred available: return strongest by signal
-        best = None
-        best_sig = -10**9
-        for n in scan:
-            sig = n.get('signal')
-            if sig is not None and sig > best_sig:
-                best = n.get('ssid')
-                best_sig = sig
-        return best
+        preferred = next((ssid for ssid in self._state.get('preferred_order', ()) if ssid in available), None)
+        if preferred:
+            return preferred
+        # No preferred available: scan() is sorted strongest first, unknown signal last
+        return next((n['ssid'] for n in scan if n.get('signal') is not None), None)
 
     def _current_ssid(self) -> str | None:
         try:
+            if self._nm is not None:
+                return self._nm_current_ssid()
             if self._has_nmcli():
                 res = self._run(['nmcli', '-t', '-f', 'active,ssid', 'dev', 'wifi'])
                 if res.returncode == 0:
-                    for line in res.stdout.splitlines():
-                        parts = line.split(':')
-                        if len(parts) >= 2 and parts[0] == 'yes':
-                            return parts[1] or None
+                    for line in res.stdout.split(b'\n'):
+                        parts = _terse_fields(line)
+                        if len(parts) >= 2 and parts[0] == b'yes':
+                            return _text(parts[1]) or None
             else:
                 res = self._run(['iwgetid', '-r'])
                 if res.returncode == 0:
-                    return (res.stdout or '').strip() or None
+                    return _text(res.stdout.strip()) or None
         except Exception:
             pass
         return None
 
     def _auto_loop(self) -> None:
+        has_nmcli = self._has_nmcli()
         while not self._stop_event.is_set():
             try:
-                with self._lock:
-                    auto = self.state.get('auto_manage', True)
-                if not auto:
-                    time.sleep(5)
+                state = self._state
+                if not state.get('auto_manage', True):
+                    if self._stop_event.wait(5):
+                        return
                     continue
                 # Only attempt programmatic connect with nmcli
-                if not self._has_nmcli():
-                    time.sleep(10)
+                if not has_nmcli:
+                    if self._stop_event.wait(10):
+                        return
                     continue
+                # Overlap the (possibly cached) scan with the current-SSID query
+                target_fut = self._executor.submit(self._best_available)
                 current = self._current_ssid()
-                target = self._best_available()
+                target = target_fut.result()
                 if target and target != current:
-                    creds = self.state.get('known_networks', {}).get(target, {})
-                    psk = creds.get('psk') or None
+                    psk = state.get('known_networks', {}).get(target, {}).get('psk') or None
                     self.connect(target, psk)
-                time.sleep(10)
+                if self._stop_event.wait(10):
+                    return
             except Exception:
-                time.sleep(10)
+                if self._stop_event.wait(10):
+                    return
 
 
 # Singleton helper
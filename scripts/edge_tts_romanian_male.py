@@ -6,11 +6,25 @@ High-quality Romanian TTS using Microsoft's neural voice
 
 import asyncio
 import edge_tts
+import hashlib
+import json
 import os
+import queue
+import shutil
 import tempfile
 import subprocess
+import threading
 from pathlib import Path
 
+try:
+    # Optional: decode and play MP3 in-process instead of forking mpg123
+    import miniaudio
+    import numpy as np
+    import sounddevice as sd
+    INPROCESS_PLAYBACK = True
+except ImportError:
+    INPROCESS_PLAYBACK = False
+
 class EdgeTTSRomanianMale:
     """High-quality Romanian TTS using Edge-TTS male voice"""
     
@@ -18,6 +32,10 @@ class EdgeTTSRomanianMale:
         self.voice = 'ro-RO-EmilNeural'  # Romanian male voice
         self.temp_dir = Path('/tmp/edge_tts_ro')
         self.temp_dir.mkdir(exist_ok=True)
+        
+        # One long-lived event loop instead of asyncio.run() per request
+        self._loop = asyncio.new_event_loop()
+        threading.Thread(target=self._loop.run_forever, daemon=True).start()
     
     async def synthesize_async(self, text, output_file=None):
         """Asynchronous Edge-TTS synthesis"""
@@ -31,10 +49,32 @@ class EdgeTTSRomanianMale:
     
     def synthesize(self, text, output_file=None):
         """Synchronous wrapper for Edge-TTS synthesis"""
-        return asyncio.run(self.synthesize_async(text, output_file))
+        return asyncio.run_coroutine_threadsafe(
+            self.synthesize_async(text, output_file), self._loop).result(timeout=30)
+    
+    def close(self):
+        """Stop the background event loop"""
+        self._loop.call_soon_threadsafe(self._loop.stop)
+    
+    async def _synth_one(self, sound_id, text, sem):
+        """Synthesize one batch entry; returns (sound_id, path, error)"""
+        async with sem:
+            try:
+                output_file = self.temp_dir / f"ro_male_sound{sound_id + 1}.mp3"
+                return sound_id, await self.synthesize_async(text, output_file), None
+            except Exception as e:
+                return sound_id, None, e
     
     def play_audio(self, audio_file):
-        """Play audio file using mpg123 (handles MP3 properly)"""
+        """Play audio file in-process when possible, otherwise with mpg123 (handles MP3 properly)"""
+        if INPROCESS_PLAYBACK:
+            try:
+                decoded = miniaudio.mp3_read_file_f32(str(audio_file))
+                samples = np.frombuffer(decoded.samples, dtype=np.float32).reshape(-1, decoded.nchannels)
+                sd.play(samples, decoded.sample_rate, blocking=True)
+                return True
+            except Exception as e:
+                print(f"In-process playback failed, using mpg123: {e}")
         try:
             result = subprocess.run(['mpg123', '-q', str(audio_file)], 
                                   capture_output=True, timeout=30)
@@ -46,6 +86,32 @@ class EdgeTTSRomanianMale:
             print(f"Audio playback error: {e}")
             return False
     
+    def synthesize_and_play_stream(self, texts):
+        """Play several phrases in order, synthesizing the next one while the current one plays"""
+        ready = queue.Queue(maxsize=2)
+        
+        async def produce():
+            loop = asyncio.get_running_loop()
+            try:
+                for i, text in enumerate(texts):
+                    audio_file = await self.synthesize_async(text, self.temp_dir / f"ro_male_stream_{i}.mp3")
+                    await loop.run_in_executor(None, ready.put, audio_file)
+            except Exception as e:
+                print(f"Synthesis error: {e}")
+            finally:
+                await loop.run_in_executor(None, ready.put, None)
+        
+        producer = asyncio.run_coroutine_threadsafe(produce(), self._loop)
+        played = 0
+        while True:
+            audio_file = ready.get()
+            if audio_file is None:
+                break
+            if self.play_audio(audio_file):
+                played += 1
+        producer.result()
+        return played == len(texts)
+    
     def test_voice(self, text="Salut, bună! Ce mai faci? Mă bucur să te văd."):
         """Test the Romanian male voice"""
         print(f"🎤 Testing Romanian male voice: '{text}'")
@@ -167,22 +233,50 @@ def regenerate_romanian_sounds():
     
     success_count = 0
     
+    # Skip phrases whose voice and text are unchanged since the last run
+    manifest_path = sounds_dir / ".edge_tts_manifest.json"
+    try:
+        with open(manifest_path) as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        manifest = {}
+    keys = {sound_id: hashlib.sha256(f"{edge_tts.voice}|{text}".encode()).hexdigest()
+            for sound_id, text in romanian_expressions.items()}
+    pending = {}
     for sound_id, text in romanian_expressions.items():
+        entry = manifest.get(str(sound_id))
+        if entry and entry.get('key') == keys[sound_id] and (sounds_dir / entry['path']).exists():
+            print(f"⏭️  sound{sound_id + 1}.mp3 unchanged, skipping")
+            success_count += 1
+            continue
+        pending[sound_id] = text
+    
+    # Synthesize all phrases on one event loop, up to 8 requests in flight
+    async def _run_batch():
+        sem = asyncio.Semaphore(8)
+        return await asyncio.gather(*[edge_tts._synth_one(sound_id, text, sem)
+                                      for sound_id, text in pending.items()])
+    
+    print(f"Generating {len(pending)} sounds...")
+    results = asyncio.run_coroutine_threadsafe(_run_batch(), edge_tts._loop).result()
+    edge_tts.close()
+    
+    for sound_id, temp_file, error in results:
         try:
-            print(f"Generating sound{sound_id + 1}.mp3: '{text}'")
-            
-            # Generate with Edge-TTS male voice
-            temp_file = edge_tts.synthesize(text)
+            if error:
+                raise error
             
             if temp_file:
-                # Copy to sounds directory
+                # Move into the sounds directory (the temp file is only used once)
                 output_file = sounds_dir / f"sound{sound_id + 1}.mp3"
-                os.system(f"cp '{temp_file}' '{output_file}'")
-                
-                # Clean up temp file
-                os.remove(temp_file)
+                try:
+                    os.replace(temp_file, output_file)
+                except OSError:
+                    # Temp dir on another filesystem (e.g. tmpfs /tmp)
+                    shutil.move(temp_file, output_file)
                 
                 print(f"✅ Generated: {output_file}")
+                manifest[str(sound_id)] = {'key': keys[sound_id], 'path': output_file.name}
                 success_count += 1
             else:
                 print(f"❌ Failed to generate sound{sound_id + 1}")
@@ -190,6 +284,12 @@ def regenerate_romanian_sounds():
         except Exception as e:
             print(f"❌ Error generating sound{sound_id + 1}: {e}")
     
+    # Record what is on disk so the next run only synthesizes changed phrases
+    tmp = manifest_path.with_suffix('.tmp')
+    with open(tmp, 'w') as f:
+        json.dump(manifest, f, indent=2)
+    os.replace(tmp, manifest_path)
+    
     print(f"\n📊 Results: {success_count}/{len(romanian_expressions)} sounds generated successfully")
     
     if success_count > 0:
@@ -6,7 +6,10 @@ Adds high-quality Romanian TTS to existing Avatar Tank system
 
 import asyncio
 import edge_tts
+import hashlib
+import json
 import os
+import shutil
 import tempfile
 from pathlib import Path
 
@@ -36,6 +39,14 @@ class EdgeTTSRomanian:
         """Synchronous wrapper for Edge-TTS synthesis"""
         return asyncio.run(self.synthesize_async(text, voice, output_file))
     
+    async def _synth_one(self, sound_id, text, sem, voice='female'):
+        """Synthesize one batch entry; returns (sound_id, path, error)"""
+        async with sem:
+            try:
+                return sound_id, await self.synthesize_async(text, voice), None
+            except Exception as e:
+                return sound_id, None, e
+    
     def test_voices(self, text="Salut, bună! Ce mai faci?"):
         """Test both Romanian voices"""
         print("🎤 Testing Edge-TTS Romanian voices...")
@@ -139,24 +150,56 @@ def regenerate_romanian_sounds():
     edge_tts = EdgeTTSRomanian()
     sounds_dir = Path("/home/havatar/Avatar-robot/sounds")
     
+    # Skip phrases whose voice and text are unchanged since the last run
+    manifest_path = sounds_dir / ".edge_tts_manifest.json"
+    try:
+        with open(manifest_path) as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        manifest = {}
+    keys = {sound_id: hashlib.sha256(f"{edge_tts.voices['female']}|{text}".encode()).hexdigest()
+            for sound_id, text in romanian_expressions.items()}
+    pending = {}
     for sound_id, text in romanian_expressions.items():
+        entry = manifest.get(str(sound_id))
+        if entry and entry.get('key') == keys[sound_id] and (sounds_dir / entry['path']).exists():
+            print(f"⏭️  sound{sound_id + 1}.mp3 unchanged, skipping")
+            continue
+        pending[sound_id] = text
+    
+    # Synthesize all phrases on one event loop, up to 8 requests in flight
+    async def _run_batch():
+        sem = asyncio.Semaphore(8)
+        return await asyncio.gather(*[edge_tts._synth_one(sound_id, text, sem, 'female')
+                                      for sound_id, text in pending.items()])
+    
+    print(f"Generating {len(pending)} sounds...")
+    results = asyncio.run(_run_batch())
+    
+    for sound_id, temp_file, error in results:
         try:
-            print(f"Generating sound{sound_id + 1}.mp3: '{text}'")
-            
-            # Generate with Edge-TTS
-            temp_file = edge_tts.synthesize(text, 'female')
+            if error:
+                raise error
             
-            # Copy to sounds directory
+            # Move into the sounds directory (the temp file is only used once)
             output_file = sounds_dir / f"sound{sound_id + 1}.mp3"
-            os.system(f"cp {temp_file} {output_file}")
-            
-            # Clean up temp file
-            os.remove(temp_file)
+            try:
+                os.replace(temp_file, output_file)
+            except OSError:
+                # Temp dir on another filesystem (e.g. tmpfs /tmp)
+                shutil.move(temp_file, output_file)
             
             print(f"✅ Generated: {output_file}")
+            manifest[str(sound_id)] = {'key': keys[sound_id], 'path': output_file.name}
             
         except Exception as e:
             print(f"❌ Failed to generate sound{sound_id + 1}: {e}")
+    
+    # Record what is on disk so the next run only synthesizes changed phrases
+    tmp = manifest_path.with_suffix('.tmp')
+    with open(tmp, 'w') as f:
+        json.dump(manifest, f, indent=2)
+    os.replace(tmp, manifest_path)
 
 def main():
     """Main function"""
@@ -4,26 +4,218 @@ Romanian TTS Quality Comparison Script
 Tests different TTS engines for Romanian language quality
 """
 
+import asyncio
+import atexit
+import hashlib
+import importlib.util
 import os
+import re
+import shutil
 import subprocess
 import sys
+import threading
+import time
+import wave
+from functools import lru_cache, partial
 from pathlib import Path
 
-def test_piper_romanian(text, output_file):
+try:
+    import edge_tts
+    EDGE_TTS_LIB_AVAILABLE = True
+except ImportError:
+    EDGE_TTS_LIB_AVAILABLE = False
+
+try:
+    from piper import PiperVoice
+    PIPER_LIB_AVAILABLE = True
+except ImportError:
+    PIPER_LIB_AVAILABLE = False
+
+PIPER_PATH = "/home/havatar/Avatar-robot/piper/bin/piper"
+PIPER_MODEL = "/home/havatar/Avatar-robot/piper/models/ro/ro_RO-mihai-medium.onnx"
+
+# Command-line tools the engines may use, looked up once
+_HAS = {name: shutil.which(name) for name in ("edge-tts", "festival", "festival_client", "text2wave")}
+
+# Engines that can run at all on this machine, decided without spawning anything
+AVAILABLE = {
+    'piper': os.path.exists(PIPER_MODEL) and (PIPER_LIB_AVAILABLE or os.path.exists(PIPER_PATH)),
+    'edge': EDGE_TTS_LIB_AVAILABLE or bool(_HAS["edge-tts"]),
+    'google': importlib.util.find_spec("gtts") is not None,
+    'festival': bool(_HAS["text2wave"] or (_HAS["festival"] and _HAS["festival_client"])),
+}
+
+# Loaded Piper voices by model path, so the ONNX model is only deserialized once
+_piper_voices = {}
+_piper_load_lock = threading.Lock()
+
+# HTTP session shared by every gTTS request (see _share_gtts_session)
+_gtts_session = None
+
+# `festival --server` kept warm across calls (see _festival_server_ready)
+FESTIVAL_PORT = 1314
+_festival_server = None
+
+# Test audio goes to RAM-backed /dev/shm where available, /tmp otherwise
+OUTPUT_DIR = Path("/dev/shm/romanian_tts_test" if os.access("/dev/shm", os.W_OK) else "/tmp/romanian_tts_test")
+
+# Synthesized audio keyed by engine, voice and text, reused on later runs;
+# kept next to the outputs so cache hits are hardlinks, not copies
+CACHE_DIR = OUTPUT_DIR / ".cache"
+
+def _link_or_copy(src, dst):
+    """Hardlink src to dst (replacing dst), copying if linking is not possible"""
+    try:
+        os.remove(dst)
+    except FileNotFoundError:
+        pass
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copyfile(src, dst)
+
+def _cache_file(engine, voice, text):
+    key = hashlib.sha256(f"{engine}|{voice}|{text}".encode()).hexdigest()
+    return CACHE_DIR / f"{key}.bin"
+
+def cache_load(engine, voice, text, output_file):
+    """Link a cached result to output_file; on a miss, clear output_file for a fresh write"""
+    cache_file = _cache_file(engine, voice, text)
+    if cache_file.exists():
+        _link_or_copy(cache_file, output_file)
+        print(f"✅ {engine} ({voice}): {output_file} (cached)")
+        return True
+    
+    # Never write through a hardlink into another cache entry
+    try:
+        os.remove(output_file)
+    except FileNotFoundError:
+        pass
+    return False
+
+def cache_store(engine, voice, text, output_file):
+    cache_file = _cache_file(engine, voice, text)
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    tmp = cache_file.with_suffix(".tmp")
+    _link_or_copy(output_file, tmp)
+    os.replace(tmp, cache_file)
+
+async def cached(engine, voice, text, output_file, fn):
+    """Serve output_file from the cache, or await fn() and cache what it wrote"""
+    if cache_load(engine, voice, text, output_file):
+        return True
+    if not await fn():
+        return False
+    cache_store(engine, voice, text, output_file)
+    return True
+
+SENTENCE_RE = re.compile(r'(?<=[.!?])\s+')
+
+def _concat_audio(parts, output_file):
+    """Join audio segments in order: WAV through the wave module, anything else (MP3) bytewise"""
+    with open(parts[0], "rb") as f:
+        is_wav = f.read(4) == b"RIFF"
+    if is_wav:
+        with wave.open(output_file, "wb") as out:
+            for i, part in enumerate(parts):
+                with wave.open(part, "rb") as seg:
+                    if i == 0:
+                        out.setparams(seg.getparams())
+                    out.writeframes(seg.readframes(seg.getnframes()))
+    else:
+        with open(output_file, "wb") as out:
+            for part in parts:
+                with open(part, "rb") as seg:
+                    shutil.copyfileobj(seg, out)
+
+async def synthesize_sentences(test_fn, text, output_file, *args, label, concurrency=3):
+    """Run test_fn per sentence (up to `concurrency` at once) and join the segments in order.
+    Success is reported once, as `label`, for output_file rather than per temporary segment."""
+    sentences = [s for s in SENTENCE_RE.split(text.strip()) if s]
+    if len(sentences) < 2:
+        return await test_fn(text, output_file, *args)
+    
+    base, ext = os.path.splitext(output_file)
+    parts = [f"{base}.part{i}{ext}" for i in range(len(sentences))]
+    sem = asyncio.Semaphore(concurrency)
+    
+    async def one(sentence, part):
+        async with sem:
+            return await test_fn(sentence, part, *args, report=False)
+    
+    try:
+        if not all(await asyncio.gather(*map(one, sentences, parts))):
+            return False
+        _concat_audio(parts, output_file)
+        print(f"✅ {label}: {output_file}")
+        return True
+    finally:
+        for part in parts:
+            try:
+                os.remove(part)
+            except FileNotFoundError:
+                pass
+
+@lru_cache(maxsize=None)
+def _executable(name):
+    """Absolute path for name, looked up on PATH once"""
+    return shutil.which(name) or name
+
+async def run(cmd, input_text=None):
+    """Run cmd on the event loop (no thread blocked while it runs)
+    
+    Every engine writes its audio to a file, so stdout is discarded; only stderr
+    is kept (decoded) for the failure message.
+    
+    An absolute executable path and close_fds=False (our fds are non-inheritable
+    anyway, PEP 446) let CPython launch via posix_spawn instead of fork+exec.
+    """
+    cmd = [_executable(cmd[0]), *cmd[1:]]
+    proc = await asyncio.create_subprocess_exec(
+        *cmd,
+        stdin=subprocess.PIPE if input_text is not None else subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL, stderr=subprocess.PIPE,
+        close_fds=False
+    )
+    _, err = await proc.communicate(input_text.encode() if input_text is not None else None)
+    return subprocess.CompletedProcess(cmd, proc.returncode, None, err.decode(errors='replace'))
+
+def _piper_synthesize(model_path, text, output_file):
+    """Synthesize with the in-process Piper binding, keeping the voice loaded"""
+    with _piper_load_lock:
+        voice = _piper_voices.get(model_path)
+        if voice is None:
+            voice = _piper_voices[model_path] = PiperVoice.load(model_path)
+    with wave.open(output_file, "wb") as wf:
+        # piper-tts >= 1.3 renamed synthesize() (which now yields chunks) to synthesize_wav()
+        if hasattr(voice, "synthesize_wav"):
+            voice.synthesize_wav(text, wf)
+        else:
+            voice.synthesize(text, wf)
+
+async def test_piper_romanian(text, output_file, report=True):
     """Test current Piper Romanian model"""
+    if not AVAILABLE['piper']:
+        return False
     try:
-        piper_path = "/home/havatar/Avatar-robot/piper/bin/piper"
-        model_path = "/home/havatar/Avatar-robot/piper/models/ro/ro_RO-mihai-medium.onnx"
+        if PIPER_LIB_AVAILABLE:
+            # Inference is CPU-bound; keep it off the event loop
+            await asyncio.get_running_loop().run_in_executor(
+                None, _piper_synthesize, PIPER_MODEL, text, output_file)
+            if report:
+                print(f"✅ Piper Romanian: {output_file}")
+            return True
         
         cmd = [
-            piper_path,
-            "--model", model_path,
+            PIPER_PATH,
+            "--model", PIPER_MODEL,
             "--output_file", output_file
         ]
         
-        result = subprocess.run(cmd, input=text, text=True, capture_output=True)
+        result = await run(cmd, text)
         if result.returncode == 0:
-            print(f"✅ Piper Romanian: {output_file}")
+            if report:
+                print(f"✅ Piper Romanian: {output_file}")
             return True
         else:
             print(f"❌ Piper Romanian failed: {result.stderr}")
@@ -32,9 +224,41 @@ def test_piper_romanian(text, output_file):
         print(f"❌ Piper Romanian error: {e}")
         return False
 
-def test_edge_tts_romanian(text, output_file, voice="ro-RO-AlinaNeural"):
+async def test_edge_tts_batch(text, voices, output_files):
+    """Test several Edge-TTS Romanian voices in one go, returning a success flag per voice
+    
+    With the edge_tts package importable, every voice is synthesized inside this
+    process, so no extra interpreter is started per voice; otherwise the CLI is used.
+    """
+    # Per-sentence requests are cheap in-process; with the CLI each one would be another
+    # interpreter start, so there it stays one call per voice
+    async def one(voice, output_file):
+        if EDGE_TTS_LIB_AVAILABLE:
+            return await synthesize_sentences(test_edge_tts_romanian, text, output_file, voice,
+                                              label=f"Edge-TTS Romanian ({voice})")
+        return await test_edge_tts_romanian(text, output_file, voice)
+    
+    return await asyncio.gather(*map(one, voices, output_files))
+
+async def _edge_tts_stream(text, output_file, voice):
+    """Write Edge-TTS audio chunks to output_file as they arrive"""
+    communicate = edge_tts.Communicate(text, voice)
+    with open(output_file, "wb") as f:
+        async for chunk in communicate.stream():
+            if chunk["type"] == "audio":
+                f.write(chunk["data"])
+
+async def test_edge_tts_romanian(text, output_file, voice="ro-RO-AlinaNeural", report=True):
     """Test Edge-TTS Romanian voices"""
+    if not AVAILABLE['edge']:
+        return False
     try:
+        if EDGE_TTS_LIB_AVAILABLE:
+            await _edge_tts_stream(text, output_file, voice)
+            if report:
+                print(f"✅ Edge-TTS Romanian ({voice}): {output_file}")
+            return True
+        
         cmd = [
             "edge-tts",
             "--voice", voice,
@@ -42,9 +266,10 @@ def test_edge_tts_romanian(text, output_file, voice="ro-RO-AlinaNeural"):
             "--write-media", output_file
         ]
         
-        result = subprocess.run(cmd, capture_output=True, text=True)
+        result = await run(cmd)
         if result.returncode == 0:
-            print(f"✅ Edge-TTS Romanian ({voice}): {output_file}")
+            if report:
+                print(f"✅ Edge-TTS Romanian ({voice}): {output_file}")
             return True
         else:
             print(f"❌ Edge-TTS Romanian failed: {result.stderr}")
@@ -53,23 +278,102 @@ def test_edge_tts_romanian(text, output_file, voice="ro-RO-AlinaNeural"):
         print(f"❌ Edge-TTS Romanian error: {e}")
         return False
 
-def test_google_tts_romanian(text, output_file):
+def _share_gtts_session():
+    """Make gTTS reuse one pooled requests.Session instead of a new one per request
+    
+    gTTS opens `with requests.Session() as s:` for every call, paying a fresh TCP
+    and TLS handshake each time; hand it a shared session that survives the block.
+    """
+    global _gtts_session
+    if _gtts_session is not None:
+        return
+    import requests
+    import gtts.tts
+    
+    class SharedSession(requests.Session):
+        def __exit__(self, *args):
+            pass
+    
+    class RequestsShim:
+        def __getattr__(self, name):
+            return getattr(requests, name)
+        
+        @staticmethod
+        def Session():
+            return _gtts_session
+    
+    _gtts_session = SharedSession()
+    _gtts_session.mount("https://", requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=4))
+    # Older gTTS releases call requests.post directly and are left alone
+    if hasattr(gtts.tts, "requests"):
+        gtts.tts.requests = RequestsShim()
+
+async def test_google_tts_romanian(text, output_file):
     """Test Google TTS Romanian"""
+    if not AVAILABLE['google']:
+        return False
     try:
         from gtts import gTTS
+        _share_gtts_session()
         tts = gTTS(text, lang='ro')
-        tts.save(output_file)
+        # gTTS uses blocking requests; keep it off the event loop
+        await asyncio.get_running_loop().run_in_executor(None, tts.save, output_file)
         print(f"✅ Google TTS Romanian: {output_file}")
         return True
     except Exception as e:
         print(f"❌ Google TTS Romanian error: {e}")
         return False
 
-def test_festival_romanian(text, output_file):
+def _stop_festival_server():
+    if _festival_server is not None and _festival_server.poll() is None:
+        _festival_server.terminate()
+        try:
+            _festival_server.wait(timeout=2)
+        except subprocess.TimeoutExpired:
+            _festival_server.kill()
+
+async def _festival_server_ready(timeout=5.0):
+    """Start `festival --server` once and wait for it to accept connections
+    
+    The server loads its voices and lexicons a single time; festival_client then
+    only pays for synthesis. Returns False if the server cannot be used.
+    """
+    global _festival_server
+    if _festival_server is None:
+        if not (_HAS["festival"] and _HAS["festival_client"]):
+            return False
+        try:
+            _festival_server = subprocess.Popen(
+                [_executable("festival"), "--server"],
+                stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+            )
+        except OSError:
+            return False
+        atexit.register(_stop_festival_server)
+    
+    deadline = time.monotonic() + timeout
+    while _festival_server.poll() is None and time.monotonic() < deadline:
+        try:
+            _, writer = await asyncio.open_connection("localhost", FESTIVAL_PORT)
+        except OSError:
+            await asyncio.sleep(0.1)
+            continue
+        writer.close()
+        return True
+    return False
+
+async def test_festival_romanian(text, output_file):
     """Test Festival Romanian (if available)"""
+    if not AVAILABLE['festival']:
+        return False
     try:
-        cmd = ["festival", "--tts"]
-        result = subprocess.run(cmd, input=text, text=True, capture_output=True)
+        if await _festival_server_ready():
+            cmd = ["festival_client", "--server", "localhost", "--port", str(FESTIVAL_PORT),
+                   "--ttw", "--output", output_file]
+        else:
+            # text2wave renders to a file; festival --tts would only play through the speakers
+            cmd = ["text2wave", "-o", output_file]
+        result = await run(cmd, text)
         if result.returncode == 0:
             print(f"✅ Festival Romanian: {output_file}")
             return True
@@ -80,6 +384,10 @@ def test_festival_romanian(text, output_file):
         print(f"❌ Festival Romanian error: {e}")
         return False
 
+SUMMARY_HEADER = "\n" + "=" * 50 + "\n📊 RESULTS SUMMARY:\n" + "=" * 50 + "\n"
+SUMMARY_ROW = "{:15} : {}\n"
+STATUS = ("❌ FAILED", "✅ SUCCESS")
+
 def main():
     """Main comparison function"""
     print("🎤 Romanian TTS Quality Comparison")
@@ -92,43 +400,72 @@ def main():
     print()
     
     # Create output directory
-    output_dir = Path("/tmp/romanian_tts_test")
-    output_dir.mkdir(exist_ok=True)
+    output_dir = OUTPUT_DIR
+    os.makedirs(output_dir, exist_ok=True)
     
-    results = {}
+    # The engines are independent and mostly wait on subprocesses or the network,
+    # so run them all at once on one event loop; total time is roughly the slowest engine
+    print("Testing Piper, Edge-TTS (female/male), Google TTS and Festival concurrently...")
+    for engine, ok in AVAILABLE.items():
+        if not ok:
+            print(f"⏭️  {engine}: not installed, skipped")
     
-    # Test Piper (current)
-    print("1. Testing Piper Romanian (current)...")
-    results['piper'] = test_piper_romanian(test_text, str(output_dir / "piper_ro.mp3"))
+    def job(engine, voice, filename, test_fn, *args):
+        output_file = str(output_dir / filename)
+        return cached(engine, voice, test_text, output_file,
+                      partial(test_fn, test_text, output_file, *args))
     
-    # Test Edge-TTS Female
-    print("\n2. Testing Edge-TTS Romanian Female...")
-    results['edge_female'] = test_edge_tts_romanian(test_text, str(output_dir / "edge_ro_female.mp3"), "ro-RO-AlinaNeural")
+    edge_voices = {
+        'edge_female': ("ro-RO-AlinaNeural", str(output_dir / "edge_ro_female.mp3")),
+        'edge_male': ("ro-RO-EmilNeural", str(output_dir / "edge_ro_male.mp3")),
+    }
     
-    # Test Edge-TTS Male
-    print("\n3. Testing Edge-TTS Romanian Male...")
-    results['edge_male'] = test_edge_tts_romanian(test_text, str(output_dir / "edge_ro_male.mp3"), "ro-RO-EmilNeural")
+    async def edge_job():
+        # Only voices missing from the cache go into the batch
+        results = {name: cache_load('edge-tts', voice, test_text, output_file)
+                   for name, (voice, output_file) in edge_voices.items()}
+        pending = [name for name, ok in results.items() if not ok]
+        if pending:
+            voices, output_files = zip(*(edge_voices[name] for name in pending))
+            oks = await test_edge_tts_batch(test_text, voices, output_files)
+            for name, voice, output_file, ok in zip(pending, voices, output_files, oks):
+                if ok:
+                    cache_store('edge-tts', voice, test_text, output_file)
+                results[name] = ok
+        return results
     
-    # Test Google TTS
-    print("\n4. Testing Google TTS Romanian...")
-    results['google'] = test_google_tts_romanian(test_text, str(output_dir / "google_ro.mp3"))
+    # Only engines that are installed get scheduled at all
+    jobs = {}
+    if AVAILABLE['piper']:
+        jobs['piper'] = job('piper', "ro_RO-mihai-medium", "piper_ro.mp3",
+                            # Per sentence only with the binding: each piper binary run reloads the model
+                            partial(synthesize_sentences, test_piper_romanian, label="Piper Romanian")
+                            if PIPER_LIB_AVAILABLE else test_piper_romanian)
+    if AVAILABLE['edge']:
+        jobs['edge'] = edge_job()
+    if AVAILABLE['google']:
+        jobs['google'] = job('gtts', "ro", "google_ro.mp3", test_google_tts_romanian)
+    if AVAILABLE['festival']:
+        jobs['festival'] = job('festival', "default", "festival_ro.wav", test_festival_romanian)
     
-    # Test Festival
-    print("\n5. Testing Festival Romanian...")
-    results['festival'] = test_festival_romanian(test_text, str(output_dir / "festival_ro.wav"))
+    async def run_all():
+        return await asyncio.gather(*jobs.values())
     
-    print("\n" + "=" * 50)
-    print("📊 RESULTS SUMMARY:")
-    print("=" * 50)
+    done = dict(zip(jobs, asyncio.run(run_all())))
+    results = {
+        'piper': done.get('piper', False),
+        **done.get('edge', dict.fromkeys(edge_voices, False)),
+        'google': done.get('google', False),
+        'festival': done.get('festival', False),
+    }
     
-    for engine, success in results.items():
-        status = "✅ SUCCESS" if success else "❌ FAILED"
-        print(f"{engine:15} : {status}")
+    rows = "".join(SUMMARY_ROW.format(engine, STATUS[bool(success)]) for engine, success in results.items())
+    sys.stdout.write(SUMMARY_HEADER + rows)
     
     print(f"\n📁 Test files saved to: {output_dir}")
     print("\n🎧 To test audio quality, play the files:")
-    for file in output_dir.glob("*"):
-        print(f"   aplay {file}")
+    files = sorted(e.name for e in os.scandir(output_dir) if e.is_file())
+    sys.stdout.write("".join(f"   aplay {output_dir}/{name}\n" for name in files))
     
     print("\n💡 RECOMMENDATIONS:")
     if results.get('edge_female') or results.get('edge_male'):
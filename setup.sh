@@ -120,6 +120,14 @@ else
     exit 1
 fi
 
+# Build optional compiled word predictor core (pure-Python fallback is used otherwise)
+print_status "Building word predictor core..."
+if pip install cython && cythonize -i modules/_predict_core.pyx; then
+    print_success "Word predictor core compiled"
+else
+    print_warning "Could not compile word predictor core, using pure-Python fallback"
+fi
+
 # Make scripts executable
 print_status "Making scripts executable..."
 chmod +x *.sh